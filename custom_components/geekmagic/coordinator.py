@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import math
+import sys
 import time
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, cast
@@ -16,6 +18,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
+from PIL import __version__ as pil_version
+from PIL import features as pil_features
 
 from .const import (
     BACKOFF_LOG_INTERVAL,
@@ -84,6 +88,7 @@ from .widgets.climate import ClimateWidget
 from .widgets.clock import ClockWidget
 from .widgets.entity import EntityWidget
 from .widgets.gauge import GaugeWidget
+from .widgets.helpers import make_hashable
 from .widgets.icon import IconWidget
 from .widgets.media import MediaWidget
 from .widgets.progress import MultiProgressWidget, ProgressWidget
@@ -94,14 +99,20 @@ from .widgets.theme import get_theme
 from .widgets.weather import WeatherWidget
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
     from .layouts.base import Layout
     from .store import GeekMagicStore
+    from .widgets.base import Widget
 
 _LOGGER = logging.getLogger(__name__)
 
 # Config key for new global views format
 CONF_ASSIGNED_VIEWS = "assigned_views"
 
+# Whether Pillow's JPEG codec is libjpeg-turbo (SIMD-accelerated encoding)
+JPEG_TURBO_AVAILABLE: bool = bool(pil_features.check_feature("libjpeg_turbo"))
+
 LAYOUT_CLASSES = {
     LAYOUT_GRID_2X2: Grid2x2,
     LAYOUT_GRID_2X3: Grid2x3,
@@ -212,9 +223,18 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         self.options = self._migrate_options(options)
         self.renderer = Renderer()
         self._layouts: list = []  # List of layouts for each screen
+        # Widget instances by config, reused across screen rebuilds
+        self._widgets: dict[WidgetConfig, Widget] = {}
+        # Layouts by frozen screen config, reused when a screen is unchanged
+        self._screen_layouts: dict[Hashable, Layout] = {}
         self._current_screen: int = 0
-        self._last_screen_change: float = time.time()
-        self._last_image: bytes | None = None  # PNG bytes for camera preview
+        # Auto-cycle interval (hoisted from options) and its monotonic deadline
+        self._cycle_interval: float = float(
+            self.options.get(CONF_SCREEN_CYCLE_INTERVAL, DEFAULT_SCREEN_CYCLE_INTERVAL)
+        )
+        self._next_cycle_at: float = math.inf
+        self._reset_cycle_deadline()
+        self._last_image: bytes | None = None  # JPEG bytes for the preview image
         self._last_update_success: bool = False
         self._last_update_time: float | None = None
         self.config_entry = config_entry
@@ -266,6 +286,14 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             device.host,
             interval,
         )
+        _LOGGER.debug(
+            "Rendering with Pillow %s (libjpeg-turbo: %s)", pil_version, JPEG_TURBO_AVAILABLE
+        )
+        if not JPEG_TURBO_AVAILABLE:
+            _LOGGER.warning(
+                "Pillow is not built with libjpeg-turbo; JPEG encoding for %s will be slower",
+                device.host,
+            )
 
         # Initialize screens
         self._setup_screens()
@@ -306,14 +334,24 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         - Legacy format: screens list with inline config (for backward compatibility)
         """
         self._layouts = []
+        previous_layouts = self._screen_layouts
+        self._screen_layouts = {}
 
         # Check for new format first (global views)
         assigned_views = self.options.get(CONF_ASSIGNED_VIEWS, [])
         if assigned_views:
-            self._setup_from_global_views(assigned_views)
+            self._setup_from_global_views(assigned_views, previous_layouts)
         else:
             # Fall back to legacy format
-            self._setup_from_legacy_screens()
+            self._setup_from_legacy_screens(previous_layouts)
+
+        # Keep only the widgets the new screens use
+        self._widgets = {
+            slot.widget.config: slot.widget
+            for layout in self._layouts
+            for slot in layout.slots
+            if slot.widget is not None
+        }
 
         # Ensure current screen is valid
         if self._current_screen >= len(self._layouts):
@@ -323,16 +361,19 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             )
             self._current_screen = 0
 
-    def _setup_from_global_views(self, view_ids: list[str]) -> None:
+    def _setup_from_global_views(
+        self, view_ids: list[str], previous_layouts: dict[Hashable, Layout]
+    ) -> None:
         """Set up layouts from global views in store.
 
         Args:
             view_ids: List of view IDs to load
+            previous_layouts: Layouts from the last setup, by frozen screen config
         """
         store = self._get_store()
         if not store:
             _LOGGER.warning("Store not available, falling back to legacy config")
-            self._setup_from_legacy_screens()
+            self._setup_from_legacy_screens(previous_layouts)
             return
 
         _LOGGER.debug("Setting up %d view(s) from global store", len(view_ids))
@@ -344,7 +385,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                 continue
 
             view_name = view_config.get("name", f"View {i + 1}")
-            layout = self._create_layout(view_config)
+            layout = self._get_or_create_layout(view_config, previous_layouts)
             self._layouts.append(layout)
             _LOGGER.debug(
                 "Created view %d '%s' with layout %s (%d slots)",
@@ -354,14 +395,18 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                 layout.get_slot_count(),
             )
 
-    def _setup_from_legacy_screens(self) -> None:
-        """Set up layouts from legacy screens config (backward compatibility)."""
+    def _setup_from_legacy_screens(self, previous_layouts: dict[Hashable, Layout]) -> None:
+        """Set up layouts from legacy screens config (backward compatibility).
+
+        Args:
+            previous_layouts: Layouts from the last setup, by frozen screen config
+        """
         screens = self.options.get(CONF_SCREENS, [])
         _LOGGER.debug("Setting up %d screen(s) from legacy config", len(screens))
 
         for i, screen_config in enumerate(screens):
             screen_name = screen_config.get("name", f"Screen {i + 1}")
-            layout = self._create_layout(screen_config)
+            layout = self._get_or_create_layout(screen_config, previous_layouts)
             self._layouts.append(layout)
             _LOGGER.debug(
                 "Created screen %d '%s' with layout %s (%d slots)",
@@ -371,6 +416,30 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                 layout.get_slot_count(),
             )
 
+    def _get_or_create_layout(
+        self, screen_config: dict[str, Any], previous_layouts: dict[Hashable, Layout]
+    ) -> Layout:
+        """Return the layout for a screen config, reusing it if unchanged.
+
+        Keeps the widgets, tile cache and canvas of screens whose config did
+        not change since the last setup.
+
+        Args:
+            screen_config: Screen configuration dictionary
+            previous_layouts: Layouts from the last setup, by frozen screen config
+
+        Returns:
+            Existing layout for an unchanged screen, otherwise a new one
+        """
+        key = make_hashable(screen_config)
+        layout = self._screen_layouts.get(key)
+        if layout is None:
+            layout = previous_layouts.get(key)
+        if layout is None:
+            layout = self._create_layout(screen_config)
+        self._screen_layouts[key] = layout
+        return layout
+
     def _get_store(self) -> GeekMagicStore | None:
         """Get the global view store.
 
@@ -481,21 +550,27 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         if not widgets_config:
             widgets_config = [{"type": "clock", "slot": 0}]
 
+        # Hoisted out of the loop; this runs for every screen on each options update
+        slot_count = layout.get_slot_count()
+        get_widget_class = WIDGET_CLASSES.get
+
         for widget_config in widgets_config:
-            widget_type = str(widget_config.get("type", "text"))
-            slot = int(widget_config.get("slot", 0))
+            get = widget_config.get
+            # Interned so the type matches registry keys by identity
+            widget_type = sys.intern(str(get("type", "text")))
+            slot = int(get("slot", 0))
 
-            if slot >= layout.get_slot_count():
+            if slot >= slot_count:
                 continue
 
-            widget_class = WIDGET_CLASSES.get(widget_type)
+            widget_class = get_widget_class(widget_type)
             if widget_class is None:
                 continue
 
-            entity_id = widget_config.get("entity_id")
-            label = widget_config.get("label")
-            raw_color = widget_config.get("color")
-            widget_options = widget_config.get("options") or {}
+            entity_id = get("entity_id")
+            label = get("label")
+            raw_color = get("color")
+            widget_options = get("options") or {}
 
             # Parse color - can be tuple/list of RGB values
             parsed_color: tuple[int, int, int] | None = None
@@ -511,7 +586,12 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                 options=cast("dict[str, Any]", widget_options),
             )
 
-            widget = widget_class(config)
+            # Equal configs share one widget instance (widgets render purely
+            # from config and state)
+            widget = self._widgets.get(config)
+            if widget is None:
+                widget = widget_class(config)
+                self._widgets[config] = widget
             layout.set_widget(slot, widget)
 
         return layout
@@ -552,17 +632,22 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         Args:
             screen_index: Screen index (0-based)
         """
-        if 0 <= screen_index < len(self._layouts):
-            self._current_screen = screen_index
-            self._last_screen_change = time.time()
+        if not 0 <= screen_index < len(self._layouts):
+            return
+        # Already showing this screen, nothing to re-render or upload
+        if screen_index == self._current_screen and self._display_mode != "builtin":
+            return
 
-            # If in builtin mode, switch to custom mode so the screen change is rendered
-            if self._display_mode == "builtin":
-                _LOGGER.debug("Switching from builtin to custom mode for screen change")
-                self._display_mode = "custom"
-                await self.device.set_theme_custom()
+        self._current_screen = screen_index
+        self._reset_cycle_deadline()
 
-            await self.async_request_refresh()
+        # If in builtin mode, switch to custom mode so the screen change is rendered
+        if self._display_mode == "builtin":
+            _LOGGER.debug("Switching from builtin to custom mode for screen change")
+            self._display_mode = "custom"
+            await self.device.set_theme_custom()
+
+        await self.async_request_refresh()
 
     async def async_next_screen(self) -> None:
         """Switch to the next screen."""
@@ -590,6 +675,13 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                 except Exception as err:
                     _LOGGER.debug("Pro navigate_previous failed (non-fatal): %s", err)
 
+    def _reset_cycle_deadline(self) -> None:
+        """Restart the auto-cycle countdown from now."""
+        if self._cycle_interval > 0:
+            self._next_cycle_at = time.monotonic() + self._cycle_interval
+        else:
+            self._next_cycle_at = math.inf
+
     def update_options(self, options: dict[str, Any]) -> None:
         """Update coordinator options.
 
@@ -603,12 +695,39 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         self._base_update_interval = interval
         self.update_interval = timedelta(seconds=interval)
 
+        # Update auto-cycle interval (restarts the countdown)
+        self._cycle_interval = float(
+            self.options.get(CONF_SCREEN_CYCLE_INTERVAL, DEFAULT_SCREEN_CYCLE_INTERVAL)
+        )
+        self._reset_cycle_deadline()
+
         # Rebuild all screens
         self._setup_screens()
 
         # Update preview on next refresh (config changed)
         self._update_preview = True
 
+    def _snapshot_entity_states(self, entity_ids: Iterable[str]) -> dict[str, EntityState]:
+        """Read the current state of each entity from Home Assistant.
+
+        Args:
+            entity_ids: Entity IDs to look up (without duplicates)
+
+        Returns:
+            Dict mapping entity ID to EntityState, missing entities are omitted
+        """
+        get_state = self.hass.states.get
+        snapshot: dict[str, EntityState] = {}
+        for entity_id in entity_ids:
+            ha_state = get_state(entity_id)
+            if ha_state:
+                snapshot[entity_id] = EntityState(
+                    entity_id=ha_state.entity_id,
+                    state=ha_state.state,
+                    attributes=dict(ha_state.attributes),
+                )
+        return snapshot
+
     def _build_widget_states(self, layout: Layout) -> dict[int, WidgetState]:
         """Build WidgetState for all widgets in a layout.
 
@@ -630,33 +749,30 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         tz = getattr(self.hass.config, "time_zone_obj", None) or UTC
         now = datetime.now(tz=tz)
 
+        # Snapshot every referenced entity once per tick, so widgets sharing
+        # an entity share one lookup and one attributes copy
+        entity_ids = dict.fromkeys(layout.get_all_entities())
+        for slot in layout.slots:
+            if slot.widget is not None and slot.widget.config.entity_id:
+                entity_ids[slot.widget.config.entity_id] = None
+        entity_states = self._snapshot_entity_states(entity_ids)
+        # Rendered template sources, shared by widgets within this tick
+        template_results: dict[str, str | None] = {}
+
         for slot in layout.slots:
             widget = slot.widget
             if widget is None:
                 continue
 
-            # Build EntityState for primary entity
-            primary_entity = None
-            if widget.config.entity_id:
-                ha_state = self.hass.states.get(widget.config.entity_id)
-                if ha_state:
-                    primary_entity = EntityState(
-                        entity_id=ha_state.entity_id,
-                        state=ha_state.state,
-                        attributes=dict(ha_state.attributes),
-                    )
+            # EntityState for primary entity
+            primary_id = widget.config.entity_id
+            primary_entity = entity_states.get(primary_id) if primary_id else None
 
-            # Build EntityState for additional entities
+            # EntityState for additional entities
             additional: dict[str, EntityState] = {}
             for eid in widget.get_entities():
-                if eid != widget.config.entity_id:
-                    ha_state = self.hass.states.get(eid)
-                    if ha_state:
-                        additional[eid] = EntityState(
-                            entity_id=ha_state.entity_id,
-                            state=ha_state.state,
-                            attributes=dict(ha_state.attributes),
-                        )
+                if eid != primary_id and eid in entity_states:
+                    additional[eid] = entity_states[eid]
 
             # Get pre-fetched chart history
             history: list[float] = []
@@ -685,8 +801,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             widget_now = now
             if isinstance(widget, ClockWidget) and hasattr(widget, "timezone") and widget.timezone:
                 with contextlib.suppress(Exception):
-                    widget_tz = ZoneInfo(widget.timezone)
-                    widget_now = datetime.now(tz=widget_tz)
+                    widget_now = now.astimezone(ZoneInfo(widget.timezone))
 
             states[slot.index] = WidgetState(
                 entity=primary_entity,
@@ -695,6 +810,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                     self.hass,
                     widget.config.widget_type,
                     widget.config.options,
+                    template_results,
                 ),
                 history=history,
                 image=image,
@@ -704,11 +820,11 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
 
         return states
 
-    def _render_display(self) -> tuple[bytes, bytes]:
+    def _render_display(self) -> bytes:
         """Render the display image (runs in executor thread).
 
         Returns:
-            Tuple of (jpeg_data, png_data)
+            JPEG image bytes (sent to the device and reused for the preview)
         """
         # Render current screen's layout
         if self._layouts and 0 <= self._current_screen < len(self._layouts):
@@ -719,10 +835,6 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                 _LOGGER.debug("Rendering active notification")
                 layout = self._create_notification_layout(self._notification_data)
 
-            # Create canvas using the active layout theme background so gaps
-            # between cards match the selected theme.
-            img, draw = self.renderer.create_canvas(background=layout.theme.background)
-
             _LOGGER.debug(
                 "Rendering layout %s with %d widgets",
                 type(layout).__name__,
@@ -730,7 +842,9 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             )
             # Build widget states
             widget_states = self._build_widget_states(layout)
-            layout.render(self.renderer, draw, widget_states)
+            # The layout keeps its canvas (theme background fills the gaps
+            # between cards) and only re-pastes slots that changed
+            img = layout.render_frame(self.renderer, widget_states)
         else:
             # No screens configured - show welcome screen with live data
             _LOGGER.debug("No screens configured, rendering welcome screen")
@@ -740,13 +854,10 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             widget_states = self._build_widget_states(welcome_layout)
             welcome_layout.render(self.renderer, draw, widget_states)
 
-        # Encode to both formats
+        # Encode once; the preview image serves the same JPEG as the device
         jpeg_quality = self.options.get(CONF_JPEG_QUALITY, DEFAULT_JPEG_QUALITY)
         rotation = self.options.get(CONF_DISPLAY_ROTATION, DEFAULT_DISPLAY_ROTATION)
-        jpeg_data = self.renderer.to_jpeg(img, quality=jpeg_quality, rotation=rotation)
-        png_data = self.renderer.to_png(img, rotation=rotation)
-
-        return jpeg_data, png_data
+        return self.renderer.to_jpeg(img, quality=jpeg_quality, rotation=rotation)
 
     async def trigger_notification(self, data: dict[str, Any]) -> None:
         """Trigger a notification on this device.
@@ -919,23 +1030,22 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                 )
                 self._reset_backoff()
 
-            _LOGGER.debug(
-                "Starting display update for screen %d/%d (%s)",
-                self._current_screen + 1,
-                len(self._layouts),
-                self.current_screen_name,
-            )
+            # current_screen_name may hit the view store, only resolve it when logged
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Starting display update for screen %d/%d (%s)",
+                    self._current_screen + 1,
+                    len(self._layouts),
+                    self.current_screen_name,
+                )
 
-            # Check for auto-cycling
-            cycle_interval = self.options.get(
-                CONF_SCREEN_CYCLE_INTERVAL, DEFAULT_SCREEN_CYCLE_INTERVAL
-            )
-            if cycle_interval > 0 and len(self._layouts) > 1:
-                now = time.time()
-                if now - self._last_screen_change >= cycle_interval:
+            # Check for auto-cycling (deadline is inf when cycling is disabled)
+            if len(self._layouts) > 1:
+                now = time.monotonic()
+                if now >= self._next_cycle_at:
                     old_screen = self._current_screen
                     self._current_screen = (self._current_screen + 1) % len(self._layouts)
-                    self._last_screen_change = now
+                    self._next_cycle_at = now + self._cycle_interval
                     _LOGGER.debug(
                         "Auto-cycled screen from %d to %d",
                         old_screen,
@@ -998,20 +1108,16 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
 
             # Render image in executor to avoid blocking the event loop
             # (Pillow image operations are CPU-intensive)
-            jpeg_data, png_data = await self.hass.async_add_executor_job(self._render_display)
+            jpeg_data = await self.hass.async_add_executor_job(self._render_display)
 
             # Only update preview image on config changes or manual refresh
             # (prevents HA UI from refreshing during periodic updates)
             self._preview_just_updated = self._update_preview
             if self._update_preview:
-                self._last_image = png_data
+                self._last_image = jpeg_data
                 self._update_preview = False
 
-            _LOGGER.debug(
-                "Rendered image: JPEG=%d bytes, PNG=%d bytes",
-                len(jpeg_data),
-                len(png_data),
-            )
+            _LOGGER.debug("Rendered image: JPEG=%d bytes", len(jpeg_data))
 
             await self.device.upload_and_display(jpeg_data, "dashboard.jpg")
 
@@ -1019,9 +1125,10 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             self._last_update_success = True
             self._last_update_time = time.time()
 
+            screen_name = self.current_screen_name
             _LOGGER.debug(
                 "Display update completed: screen=%s, size=%.1fKB",
-                self.current_screen_name,
+                screen_name,
                 len(jpeg_data) / 1024,
             )
 
@@ -1029,7 +1136,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                 "success": True,
                 "size_kb": len(jpeg_data) / 1024,
                 "current_screen": self._current_screen,
-                "screen_name": self.current_screen_name,
+                "screen_name": screen_name,
             }
 
         except UpdateFailed:
@@ -1145,7 +1252,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
 
     @property
     def last_image(self) -> bytes | None:
-        """Get the last rendered image as PNG bytes."""
+        """Get the last rendered preview image as JPEG bytes."""
         return self._last_image
 
     @property
@@ -1242,7 +1349,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         else:
             # Custom mode - value is view index
             self._current_screen = value
-            self._last_screen_change = time.time()
+            self._reset_cycle_deadline()
 
     async def async_set_brightness(self, brightness: int) -> None:
         """Set display brightness.
@@ -42,7 +42,7 @@ class GeekMagicPreviewImage(ImageEntity):
 
     _attr_has_entity_name = True
     _attr_name = "Display Preview"
-    _attr_content_type = "image/png"
+    _attr_content_type = "image/jpeg"
     # Disable state polling - we update via coordinator listener only on config changes
     _attr_should_poll = False
 
@@ -66,6 +66,10 @@ class GeekMagicPreviewImage(ImageEntity):
             "model": "SmallTV Pro",
         }
 
+        # Last image announced to the frontend; compared by identity so repeated
+        # listener calls for the same render don't bump the timestamp
+        self._announced_image: bytes | None = coordinator.last_image
+
         # Set initial timestamp
         if coordinator.last_image is not None:
             self._attr_image_last_updated = dt_util.utcnow()
@@ -85,10 +89,17 @@ class GeekMagicPreviewImage(ImageEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator.
 
-        Only updates state when preview_just_updated is True (config changed).
-        Periodic refreshes do NOT trigger state updates, preventing re-renders.
+        Only updates state when preview_just_updated is True (config changed)
+        and the coordinator holds a new image object. Periodic refreshes do NOT
+        trigger state updates, preventing re-renders.
         """
-        if self.coordinator.preview_just_updated and self.coordinator.last_image is not None:
+        image = self.coordinator.last_image
+        if (
+            self.coordinator.preview_just_updated
+            and image is not None
+            and image is not self._announced_image
+        ):
+            self._announced_image = image
             self._attr_image_last_updated = dt_util.utcnow()
             self._cached_image = None
             self.async_write_ha_state()
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from PIL import Image
@@ -16,13 +18,41 @@ from ..widgets.state import WidgetState
 from ..widgets.theme import DEFAULT_THEME, Theme
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from PIL import ImageDraw
 
     from ..renderer import Renderer
     from ..widgets.base import Widget
 
+# Scanline darkening per channel value, matching int(value * 0.7) per pixel
+_SCANLINE_DARKNESS = 0.7
+_SCANLINE_LUT = [int(value * _SCANLINE_DARKNESS) for value in range(256)] * 3
+
+# Maximum number of rendered slot images kept per layout.
+# A 2x2 grid tile is ~140KB at 2x supersampling, fullscreen ~600KB.
+TILE_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=4)
+def _scanline_mask(width: int, height: int, spacing: int) -> Image.Image:
+    """Build an L-mode mask selecting every Nth row of the canvas.
+
+    Args:
+        width: Canvas width
+        height: Canvas height
+        spacing: Row spacing between scanlines
 
-@dataclass
+    Returns:
+        Mask image, 255 on scanline rows and 0 elsewhere
+    """
+    line = b"\xff" * width
+    gap = bytes(width)
+    data = b"".join(line if y % spacing == 0 else gap for y in range(height))
+    return Image.frombuffer("L", (width, height), data, "raw", "L", 0, 1)
+
+
+@dataclass(slots=True)
 class Slot:
     """Represents a widget slot in a layout."""
 
@@ -47,6 +77,12 @@ class Layout(ABC):
         self.height = DISPLAY_HEIGHT
         self.slots: list[Slot] = []
         self.theme: Theme = DEFAULT_THEME  # Default theme, can be overridden
+        # Rendered slot images keyed by widget state (LRU, see TILE_CACHE_SIZE)
+        self._tile_cache: OrderedDict[Hashable, Image.Image] = OrderedDict()
+        # Persistent canvas for render_frame and the tile key painted per slot
+        self._canvas: Image.Image | None = None
+        self._canvas_background: tuple[int, int, int] | None = None
+        self._painted: dict[int, Hashable | None] = {}
         self._calculate_slots()
 
     @abstractmethod
@@ -140,43 +176,174 @@ class Layout(ABC):
         if widget_states is None:
             widget_states = {}
 
+        empty_state = WidgetState()
+
         for slot in self.slots:
             widget = slot.widget
             if widget is None:
                 continue
 
-            # Calculate slot dimensions in scaled coordinates
-            x1, y1, x2, y2 = slot.rect
-            slot_width = (x2 - x1) * scale
-            slot_height = (y2 - y1) * scale
+            state = widget_states.get(slot.index, empty_state)
+            temp_img, _ = self._get_slot_image(renderer, slot, widget, state)
 
-            # Create temporary image for this widget using theme's surface color
-            temp_img = Image.new("RGB", (slot_width, slot_height), self.theme.surface)
-            temp_draw = PILImageDraw.Draw(temp_img)
+            # Paste the widget image onto the main canvas at the slot position
+            canvas.paste(temp_img, (slot.rect[0] * scale, slot.rect[1] * scale))
 
-            # Create render context with local coordinates (0, 0 to width, height)
-            # The rect is relative to the temp image, not the main canvas
-            local_rect = (0, 0, x2 - x1, y2 - y1)
-            ctx = RenderContext(temp_draw, local_rect, renderer, theme=self.theme)
-            self._draw_slot_chrome(ctx)
+        # Apply theme visual effects after all widgets are rendered
+        self._apply_theme_effects(canvas, scale)
 
-            # Get widget state for this slot
-            state = widget_states.get(slot.index, WidgetState())
+    def render_frame(
+        self,
+        renderer: Renderer,
+        widget_states: dict[int, WidgetState] | None = None,
+    ) -> Image.Image:
+        """Render the layout onto a canvas kept between frames.
 
-            # Call widget render - returns Component tree
-            result = widget.render(ctx, state)
+        Only slots whose rendered image changed since the previous frame are
+        pasted again; unchanged slots keep their pixels from the last frame.
+        Themes with post effects (scanlines) get a fresh canvas every frame,
+        since the effect is applied in place.
 
-            # Render the Component tree
-            if isinstance(result, Component):
-                result.render(ctx, 0, 0, x2 - x1, y2 - y1)
+        The returned image is owned by the layout and reused by the next
+        call, so callers must not modify it.
 
-            # Paste the widget image onto the main canvas at the slot position
-            paste_x = x1 * scale
-            paste_y = y1 * scale
-            canvas.paste(temp_img, (paste_x, paste_y))
+        Args:
+            renderer: Renderer instance
+            widget_states: Dict mapping slot index to WidgetState for each widget
+
+        Returns:
+            Rendered canvas at supersampled resolution
+        """
+        theme = self.theme
+        scale = renderer.scale
+        canvas = self._canvas
+        if (
+            canvas is None
+            or theme.scanlines
+            or self._canvas_background != theme.background
+            or canvas.size != (self.width * scale, self.height * scale)
+        ):
+            canvas, _ = renderer.create_canvas(background=theme.background)
+            self._canvas = canvas
+            self._canvas_background = theme.background
+            self._painted.clear()
+
+        if widget_states is None:
+            widget_states = {}
+
+        painted = self._painted
+        empty_state = WidgetState()
+
+        for slot in self.slots:
+            index = slot.index
+            x1, y1, x2, y2 = slot.rect
+            widget = slot.widget
+
+            if widget is None:
+                # Clear whatever a previous widget left in this slot
+                if index in painted:
+                    del painted[index]
+                    canvas.paste(theme.background, (x1 * scale, y1 * scale, x2 * scale, y2 * scale))
+                continue
+
+            state = widget_states.get(index, empty_state)
+            temp_img, cache_key = self._get_slot_image(renderer, slot, widget, state)
+
+            # Slot already shows this exact image
+            if cache_key is not None and painted.get(index) == cache_key:
+                continue
+
+            canvas.paste(temp_img, (x1 * scale, y1 * scale))
+            painted[index] = cache_key
 
-        # Apply theme visual effects after all widgets are rendered
         self._apply_theme_effects(canvas, scale)
+        return canvas
+
+    def _get_slot_image(
+        self,
+        renderer: Renderer,
+        slot: Slot,
+        widget: Widget,
+        state: WidgetState,
+    ) -> tuple[Image.Image, Hashable | None]:
+        """Get a slot image from the tile cache, rendering it on a miss.
+
+        Args:
+            renderer: Renderer instance
+            slot: Slot the widget occupies
+            widget: Widget to render
+            state: Widget state for this slot
+
+        Returns:
+            Tuple of (slot image, cache key or None if the state is uncacheable)
+        """
+        tile_cache = self._tile_cache
+
+        # Reuse the previously rendered slot image if the state is unchanged
+        state_key = widget.state_key(state)
+        if state_key is None:
+            return self._render_slot(renderer, slot, widget, state), None
+
+        cache_key = (slot.index, slot.rect, widget, self.theme, state_key)
+        temp_img = tile_cache.get(cache_key)
+        if temp_img is not None:
+            tile_cache.move_to_end(cache_key)
+            return temp_img, cache_key
+
+        temp_img = self._render_slot(renderer, slot, widget, state)
+        tile_cache[cache_key] = temp_img
+        if len(tile_cache) > TILE_CACHE_SIZE:
+            tile_cache.popitem(last=False)
+        return temp_img, cache_key
+
+    def _render_slot(
+        self,
+        renderer: Renderer,
+        slot: Slot,
+        widget: Widget,
+        state: WidgetState,
+    ) -> Image.Image:
+        """Render a single widget into an image the size of its slot.
+
+        Args:
+            renderer: Renderer instance
+            slot: Slot the widget occupies
+            widget: Widget to render
+            state: Widget state for this slot
+
+        Returns:
+            Slot image at supersampled resolution
+        """
+        # Calculate slot dimensions in scaled coordinates
+        x1, y1, x2, y2 = slot.rect
+        scale = renderer.scale
+        slot_width = (x2 - x1) * scale
+        slot_height = (y2 - y1) * scale
+
+        # Create temporary image for this widget using theme's surface color
+        temp_img = Image.new("RGB", (slot_width, slot_height), self.theme.surface)
+        temp_draw = PILImageDraw.Draw(temp_img)
+
+        # Create render context with local coordinates (0, 0 to width, height)
+        # The rect is relative to the temp image, not the main canvas
+        local_rect = (0, 0, x2 - x1, y2 - y1)
+        ctx = RenderContext(temp_draw, local_rect, renderer, theme=self.theme)
+        self._draw_slot_chrome(ctx)
+
+        # Call widget render - returns Component tree
+        result = widget.render(ctx, state)
+
+        # Render the Component tree
+        if isinstance(result, Component):
+            result.render(ctx, 0, 0, x2 - x1, y2 - y1)
+
+        return temp_img
+
+    def clear_render_cache(self) -> None:
+        """Drop all cached slot images, forcing a full re-render."""
+        self._tile_cache.clear()
+        self._canvas = None
+        self._painted.clear()
 
     def _draw_slot_chrome(self, ctx: RenderContext) -> None:
         """Draw theme card chrome (surface + optional border) for a slot.
@@ -240,23 +407,10 @@ class Layout(ABC):
         """
         # Scanlines every 3 scaled pixels (6 pixels at 2x scale)
         line_spacing = 3 * scale
-        darkness_factor = 0.7
-
-        # Use PIL pixel access for in-place modification
-        pixels = canvas.load()
-        if pixels is None:
-            return
+        mask = _scanline_mask(canvas.width, canvas.height, line_spacing)
 
-        for y in range(0, canvas.height, line_spacing):
-            for x in range(canvas.width):
-                pixel = pixels[x, y]
-                if isinstance(pixel, tuple) and len(pixel) >= 3:
-                    r, g, b = pixel[0], pixel[1], pixel[2]
-                    pixels[x, y] = (
-                        int(r * darkness_factor),
-                        int(g * darkness_factor),
-                        int(b * darkness_factor),
-                    )
+        # Darken the whole frame in C, then paste it back through the row mask
+        canvas.paste(canvas.point(_SCANLINE_LUT), mask=mask)
 
     def get_all_entities(self) -> list[str]:
         """Get all entity IDs from all widgets."""
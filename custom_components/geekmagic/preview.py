@@ -98,7 +98,7 @@ WIDGET_CLASSES = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class MockState:
     """Mock entity state for preview rendering."""
 
@@ -384,6 +384,8 @@ def render_preview(
 
     # Build widget_states dict for all slots
     widget_states: dict[int, WidgetState] = {}
+    # Rendered template sources, shared by widgets in this preview
+    template_results: dict[str, str | None] = {}
 
     # Create and assign widgets
     for widget_config in widgets_config:
@@ -440,6 +442,7 @@ def render_preview(
                 hass,
                 widget_type,
                 cast("dict[str, Any]", widget_options),
+                template_results,
             )
             if hass is not None
             else {}
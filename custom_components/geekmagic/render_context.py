@@ -80,6 +80,19 @@ class RenderContext:
         theme: Theme configuration for styling
     """
 
+    # One context is created per slot render; slots skip the per-instance
+    # __dict__ and make attribute access a fixed-offset lookup
+    __slots__ = (
+        "_draw",
+        "_renderer",
+        "_scaled_height",
+        "_theme",
+        "_x1",
+        "_y1",
+        "height",
+        "width",
+    )
+
     def __init__(
         self,
         draw: ImageDraw.ImageDraw,
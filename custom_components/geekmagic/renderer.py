@@ -6,9 +6,11 @@ Uses 2x supersampling for anti-aliased output.
 from __future__ import annotations
 
 import math
+import threading
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -32,14 +34,91 @@ if TYPE_CHECKING:
 # Supersampling scale for anti-aliasing
 SUPERSAMPLE_SCALE = 2
 
+# JPEG encoder settings that stay on libjpeg-turbo's SIMD fast path:
+# baseline (non-progressive) YCbCr 4:2:0 without the extra Huffman optimize pass
+_JPEG_SAVE_OPTIONS = {"subsampling": 2, "optimize": False, "progressive": False}
+
+# PNG is only used for the local preview, so favor encode speed over size.
+# zlib level 3 is ~35% faster than Pillow's default of 6 on flat UI frames
+# and compresses them just as well.
+_PNG_SAVE_OPTIONS = {"compress_level": 3}
+
+
+@lru_cache(maxsize=1)
+def _get_turbojpeg() -> Any | None:
+    """Load the optional PyTurboJPEG encoder (one-time dlopen of libturbojpeg).
+
+    Returns:
+        TurboJPEG instance, or None if PyTurboJPEG or libturbojpeg is unavailable
+    """
+    try:
+        from turbojpeg import TurboJPEG
+
+        return TurboJPEG()
+    except (ImportError, OSError, RuntimeError):
+        return None
+
+
+def _save_to_buffer(buffer: BytesIO, img: Image.Image, **params: Any) -> bytes:
+    """Encode an image into a reused buffer and return a copy of the bytes.
+
+    The buffer is rewound rather than truncated so its allocation is kept
+    between calls; only the bytes written by this encode are returned.
+
+    Args:
+        buffer: Reusable in-memory buffer owned by the caller
+        img: PIL Image to encode
+        **params: Arguments passed through to Image.save()
+
+    Returns:
+        Encoded image bytes
+    """
+    buffer.seek(0)
+    img.save(buffer, **params)
+    size = buffer.tell()
+    buffer.seek(0)
+    return buffer.read(size)
+
+
+def _encode_jpeg(img: Image.Image, quality: int, buffer: BytesIO) -> bytes:
+    """Encode an RGB image to baseline 4:2:0 JPEG bytes.
+
+    Uses PyTurboJPEG directly when installed, falling back to Pillow.
+
+    Args:
+        img: RGB PIL Image at final resolution
+        quality: JPEG quality (0-100)
+        buffer: Reusable buffer for the Pillow fallback
+
+    Returns:
+        JPEG image bytes
+    """
+    turbo = _get_turbojpeg()
+    if turbo is not None:
+        import numpy as np
+        from turbojpeg import TJPF_RGB, TJSAMP_420
+
+        return turbo.encode(
+            np.asarray(img),
+            quality=quality,
+            jpeg_subsample=TJSAMP_420,
+            pixel_format=TJPF_RGB,
+        )
+
+    return _save_to_buffer(buffer, img, format="JPEG", quality=quality, **_JPEG_SAVE_OPTIONS)
+
+
 # Bundled font directory (relative to this file)
 _FONTS_DIR = Path(__file__).parent / "fonts"
 
 
+@lru_cache(maxsize=128)
 def _load_font(size: int, bold: bool = False) -> FreeTypeFont | ImageFont.ImageFont:
     """Load a TrueType font or fall back to default.
 
     Prefers bundled DejaVu Sans for consistent Unicode support across platforms.
+    Cached per (size, bold) so renderers and fit_text_font's size search share
+    one font object instead of re-reading the file.
 
     Args:
         size: Font size in pixels
@@ -83,6 +162,7 @@ def _load_font(size: int, bold: bool = False) -> FreeTypeFont | ImageFont.ImageF
 _MDI_FONT = _FONTS_DIR / "materialdesignicons-webfont.ttf"
 
 
+@lru_cache(maxsize=32)
 def _load_mdi_font(size: int) -> FreeTypeFont | ImageFont.ImageFont:
     """Load MDI icon font at specified size.
 
@@ -98,6 +178,48 @@ def _load_mdi_font(size: int) -> FreeTypeFont | ImageFont.ImageFont:
         return ImageFont.load_default()
 
 
+@lru_cache(maxsize=128)
+def _basic_layout_font(
+    font: FreeTypeFont | ImageFont.ImageFont,
+) -> FreeTypeFont | ImageFont.ImageFont:
+    """Get a variant of a font that skips raqm text shaping.
+
+    Plain ASCII needs no bidi or complex-script shaping, and the basic layout
+    engine lays it out much faster than raqm.
+
+    Args:
+        font: Font as loaded (raqm layout when libraqm is available)
+
+    Returns:
+        Basic-layout variant, or the font itself if it already uses basic layout
+    """
+    if isinstance(font, ImageFont.FreeTypeFont) and font.layout_engine != ImageFont.Layout.BASIC:
+        return font.font_variant(layout_engine=ImageFont.Layout.BASIC)
+    return font
+
+
+@lru_cache(maxsize=1024)
+def _text_bbox(
+    font: FreeTypeFont | ImageFont.ImageFont, text: str
+) -> tuple[float, float, float, float]:
+    """Measure text with the layout engine draw_text will use.
+
+    Labels and values repeat across frames and widgets measure the same
+    strings several times per layout pass, so bounding boxes are cached by
+    (font, text). Fonts come from the shared font caches, so keys stay stable.
+
+    Args:
+        font: Font to measure with
+        text: Text to measure
+
+    Returns:
+        Bounding box (left, top, right, bottom) in font pixels
+    """
+    if text.isascii():
+        font = _basic_layout_font(font)
+    return font.getbbox(text)
+
+
 class Renderer:
     """Renders widgets and layouts to images using PIL with supersampling."""
 
@@ -130,6 +252,12 @@ class Renderer:
         # MDI icon font cache (keyed by scaled size)
         self._mdi_font_cache: dict[int, FreeTypeFont | ImageFont.ImageFont] = {}
 
+        # Encode buffers reused across ticks (avoids a new BytesIO per export).
+        # The coordinator's renderer runs in executor threads, so guard them.
+        self._jpeg_buffer = BytesIO()
+        self._png_buffer = BytesIO()
+        self._encode_lock = threading.Lock()
+
     @property
     def scale(self) -> int:
         """Return the supersampling scale factor."""
@@ -238,7 +366,7 @@ class Renderer:
         while low <= high:
             mid = (low + high) // 2
             font = _load_font(mid, bold=bold)
-            bbox = font.getbbox(text)
+            bbox = _text_bbox(font, text)
 
             if bbox:
                 text_width = bbox[2] - bbox[0]
@@ -253,7 +381,7 @@ class Renderer:
                 high = mid - 1
 
         # Cache the result
-        bbox = best_font.getbbox(text)
+        bbox = _text_bbox(best_font, text)
         if bbox:
             size = int(bbox[3] - bbox[1])  # Approximate from height
             cache_key = (size, bold)
@@ -402,6 +530,8 @@ class Renderer:
         """
         if font is None:
             font = self.font_regular
+        if text.isascii():
+            font = _basic_layout_font(font)
         scaled_pos = self._scale_point(position)
         draw.text(scaled_pos, text, font=font, fill=color, anchor=anchor)
 
@@ -971,7 +1101,7 @@ class Renderer:
         if font is None:
             font = self.font_regular
 
-        bbox = font.getbbox(text)
+        bbox = _text_bbox(font, text)
         if bbox:
             return int((bbox[2] - bbox[0]) / self._scale), int((bbox[3] - bbox[1]) / self._scale)
         return 0, 0
@@ -1017,18 +1147,15 @@ class Renderer:
         if rotation:
             final_img = final_img.rotate(-rotation, expand=False)
 
-        # Try at requested quality first
-        buffer = BytesIO()
-        final_img.save(buffer, format="JPEG", quality=quality)
-        result = buffer.getvalue()
+        with self._encode_lock:
+            # Try at requested quality first
+            result = _encode_jpeg(final_img, quality, self._jpeg_buffer)
 
-        # Reduce quality if size exceeds max
-        current_quality = quality
-        while len(result) > max_size and current_quality > 20:
-            current_quality -= 10
-            buffer = BytesIO()
-            final_img.save(buffer, format="JPEG", quality=current_quality)
-            result = buffer.getvalue()
+            # Reduce quality if size exceeds max
+            current_quality = quality
+            while len(result) > max_size and current_quality > 20:
+                current_quality -= 10
+                result = _encode_jpeg(final_img, current_quality, self._jpeg_buffer)
 
         return result
 
@@ -1049,9 +1176,8 @@ class Renderer:
         if rotation:
             final_img = final_img.rotate(-rotation, expand=False)
 
-        buffer = BytesIO()
-        final_img.save(buffer, format="PNG")
-        return buffer.getvalue()
+        with self._encode_lock:
+            return _save_to_buffer(self._png_buffer, final_img, format="PNG", **_PNG_SAVE_OPTIONS)
 
     def draw_welcome_screen(self, draw: ImageDraw.ImageDraw) -> None:
         """Draw a welcome screen when no configuration is set.
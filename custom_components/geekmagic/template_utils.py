@@ -6,33 +6,78 @@ import logging
 import math
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.helpers.template import Template, TemplateError
+from homeassistant.helpers.template import Template, TemplateError, is_template_string
+
+from .const import DOMAIN
+from .widgets.helpers import parse_float
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
+# hass.data key for compiled templates; stored on hass so the cache lives
+# and dies with the instance the templates are bound to
+_TEMPLATE_CACHE_KEY = f"{DOMAIN}_templates"
+_TEMPLATE_CACHE_SIZE = 512
 
-def _parse_float(value: Any) -> float | None:
-    """Parse a float value, returning None on invalid input."""
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
 
+def _get_template(hass: HomeAssistant, source: str) -> Template:
+    """Return a cached Template for a source string.
+
+    Template sources come from static widget options but are rendered on
+    every refresh; reusing the Template keeps its compiled Jinja code.
+
+    Args:
+        hass: Home Assistant instance
+        source: Stripped template source
 
-def _render_template(hass: HomeAssistant, template: Any, *, label: str = "") -> str | None:
-    """Render a Home Assistant Jinja template to a raw string."""
+    Returns:
+        Template bound to hass
+    """
+    cache: dict[str, Template] = hass.data.setdefault(_TEMPLATE_CACHE_KEY, {})
+    template = cache.get(source)
+    if template is None:
+        if len(cache) >= _TEMPLATE_CACHE_SIZE:
+            # Sources only change on config edits; start over rather than track LRU
+            cache.clear()
+        template = cache[source] = Template(source, hass)
+    return template
+
+
+def _render_template(
+    hass: HomeAssistant,
+    template: Any,
+    *,
+    label: str = "",
+    results: dict[str, str | None] | None = None,
+) -> str | None:
+    """Render a Home Assistant Jinja template to a raw string.
+
+    When a results dict is given, each source renders once per dict, so
+    widgets sharing a template within one refresh share a single render.
+    """
     if not isinstance(template, str):
         return None
 
     source = template.strip()
     if not source:
         return None
+    # Literal text renders to itself; skip the Template lookup and render
+    if not is_template_string(source):
+        return source
+
+    if results is None:
+        return _render_source(hass, source, label)
+    if source not in results:
+        results[source] = _render_source(hass, source, label)
+    return results[source]
+
 
+def _render_source(hass: HomeAssistant, source: str, label: str) -> str | None:
+    """Render a non-empty template source, logging failures."""
     try:
-        rendered = Template(source, hass).render(parse_result=False)
+        rendered = _get_template(hass, source).render(parse_result=False)
     except TemplateError as err:
         if label:
             _LOGGER.debug("Failed to render template for %s: %s", label, err)
@@ -49,18 +94,30 @@ def _render_template(hass: HomeAssistant, template: Any, *, label: str = "") ->
     return str(rendered)
 
 
-def render_string_template(hass: HomeAssistant, template: Any, *, label: str = "") -> str | None:
+def render_string_template(
+    hass: HomeAssistant,
+    template: Any,
+    *,
+    label: str = "",
+    results: dict[str, str | None] | None = None,
+) -> str | None:
     """Render a Home Assistant Jinja template and return a string."""
-    return _render_template(hass, template, label=label)
+    return _render_template(hass, template, label=label, results=results)
 
 
-def render_numeric_template(hass: HomeAssistant, template: Any, *, label: str = "") -> float | None:
+def render_numeric_template(
+    hass: HomeAssistant,
+    template: Any,
+    *,
+    label: str = "",
+    results: dict[str, str | None] | None = None,
+) -> float | None:
     """Render a Home Assistant Jinja template and coerce to finite float."""
-    rendered = _render_template(hass, template, label=label)
+    rendered = _render_template(hass, template, label=label, results=results)
     if rendered is None:
         return None
 
-    parsed = _parse_float(rendered)
+    parsed = parse_float(rendered)
     if parsed is None:
         if label:
             _LOGGER.debug("Template for %s did not resolve to a number: %s", label, rendered)
@@ -78,8 +135,39 @@ def render_numeric_template(hass: HomeAssistant, template: Any, *, label: str =
     return parsed
 
 
+# Template options per widget type: (resolved key, option key, numeric)
+_TEMPLATE_OPTIONS: dict[str, tuple[tuple[str, str, bool], ...]] = {
+    "gauge": (("min", "min_template", True), ("max", "max_template", True)),
+    "text": (("text", "text_template", False),),
+    "progress": (("target", "target_template", True),),
+    "multi_progress": (("title", "title_template", False),),
+    "status": (
+        ("on_text", "on_text_template", False),
+        ("off_text", "off_text_template", False),
+    ),
+    "status_list": (("title", "title_template", False),),
+}
+
+# Same table with the log label of each option formatted once at import
+_WIDGET_TEMPLATE_SPECS: dict[str, tuple[tuple[str, str, bool, str], ...]] = {
+    widget_type: tuple(
+        (out_key, option_key, numeric, f"{widget_type}.{option_key}")
+        for out_key, option_key, numeric in specs
+    )
+    for widget_type, specs in _TEMPLATE_OPTIONS.items()
+}
+
+# Template fields of each multi_progress item: (resolved key, option key, numeric)
+_ITEM_TEMPLATE_SPECS: tuple[tuple[str, str, bool], ...] = (
+    ("label", "label_template", False),
+    ("target", "target_template", True),
+)
+
+
 def _resolve_multi_progress_items(
-    hass: HomeAssistant, options: dict[str, Any]
+    hass: HomeAssistant,
+    options: dict[str, Any],
+    results: dict[str, str | None] | None = None,
 ) -> list[dict[str, Any]] | None:
     """Resolve template-backed multi-progress item fields."""
     items = options.get("items")
@@ -93,23 +181,21 @@ def _resolve_multi_progress_items(
         item_options = item if isinstance(item, dict) else {}
         resolved_item: dict[str, Any] = {}
 
-        label_value = render_string_template(
-            hass,
-            item_options.get("label_template"),
-            label=f"multi_progress.items[{idx}].label_template",
-        )
-        if label_value is not None:
-            resolved_item["label"] = label_value
-            any_resolved = True
-
-        target_value = render_numeric_template(
-            hass,
-            item_options.get("target_template"),
-            label=f"multi_progress.items[{idx}].target_template",
-        )
-        if target_value is not None:
-            resolved_item["target"] = target_value
-            any_resolved = True
+        for out_key, option_key, numeric in _ITEM_TEMPLATE_SPECS:
+            template = item_options.get(option_key)
+            # Skip before formatting the log label; most items have no templates
+            if template is None:
+                continue
+            render = render_numeric_template if numeric else render_string_template
+            value = render(
+                hass,
+                template,
+                label=f"multi_progress.items[{idx}].{option_key}",
+                results=results,
+            )
+            if value is not None:
+                resolved_item[out_key] = value
+                any_resolved = True
 
         resolved_items.append(resolved_item)
 
@@ -122,82 +208,33 @@ def resolve_widget_template_options(
     hass: HomeAssistant,
     widget_type: str,
     options: dict[str, Any],
+    results: dict[str, str | None] | None = None,
 ) -> dict[str, Any]:
-    """Resolve template-backed widget options."""
+    """Resolve template-backed widget options.
+
+    Args:
+        hass: Home Assistant instance
+        widget_type: Widget type the options belong to
+        options: Widget options with *_template keys
+        results: Optional rendered-source memo shared across one refresh
+
+    Returns:
+        Dict of resolved option values
+    """
     resolved: dict[str, Any] = {}
 
-    if widget_type == "gauge":
-        min_value = render_numeric_template(
-            hass,
-            options.get("min_template"),
-            label="gauge.min_template",
-        )
-        if min_value is not None:
-            resolved["min"] = min_value
-
-        max_value = render_numeric_template(
-            hass,
-            options.get("max_template"),
-            label="gauge.max_template",
-        )
-        if max_value is not None:
-            resolved["max"] = max_value
-
-    elif widget_type == "text":
-        text_value = render_string_template(
-            hass,
-            options.get("text_template"),
-            label="text.text_template",
-        )
-        if text_value is not None:
-            resolved["text"] = text_value
-
-    elif widget_type == "progress":
-        target_value = render_numeric_template(
-            hass,
-            options.get("target_template"),
-            label="progress.target_template",
-        )
-        if target_value is not None:
-            resolved["target"] = target_value
-
-    elif widget_type == "multi_progress":
-        title_value = render_string_template(
-            hass,
-            options.get("title_template"),
-            label="multi_progress.title_template",
-        )
-        if title_value is not None:
-            resolved["title"] = title_value
-
-        item_values = _resolve_multi_progress_items(hass, options)
+    for out_key, option_key, numeric, label in _WIDGET_TEMPLATE_SPECS.get(widget_type, ()):
+        template = options.get(option_key)
+        if template is None:
+            continue
+        render = render_numeric_template if numeric else render_string_template
+        value = render(hass, template, label=label, results=results)
+        if value is not None:
+            resolved[out_key] = value
+
+    if widget_type == "multi_progress":
+        item_values = _resolve_multi_progress_items(hass, options, results)
         if item_values is not None:
             resolved["items"] = item_values
 
-    elif widget_type == "status":
-        on_text_value = render_string_template(
-            hass,
-            options.get("on_text_template"),
-            label="status.on_text_template",
-        )
-        if on_text_value is not None:
-            resolved["on_text"] = on_text_value
-
-        off_text_value = render_string_template(
-            hass,
-            options.get("off_text_template"),
-            label="status.off_text_template",
-        )
-        if off_text_value is not None:
-            resolved["off_text"] = off_text_value
-
-    elif widget_type == "status_list":
-        title_value = render_string_template(
-            hass,
-            options.get("title_template"),
-            label="status_list.title_template",
-        )
-        if title_value is not None:
-            resolved["title"] = title_value
-
     return resolved
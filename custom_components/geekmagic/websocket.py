@@ -942,7 +942,7 @@ async def ws_preview_render(
                 tz_option = widget_data.get("options", {}).get("timezone")
                 if tz_option:
                     with contextlib.suppress(Exception):
-                        widget_now = datetime.now(tz=ZoneInfo(tz_option))
+                        widget_now = now.astimezone(ZoneInfo(tz_option))
 
             widget_options = widget_data.get("options", {})
             widget_states[slot] = WidgetState(
@@ -6,15 +6,22 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from .helpers import make_hashable
+
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from ..render_context import RenderContext
     from .components import Component
     from .state import WidgetState
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WidgetConfig:
-    """Configuration for a widget."""
+    """Configuration for a widget.
+
+    Immutable and hashable, so equal configs can share one widget instance.
+    """
 
     widget_type: str
     slot: int = 0
@@ -23,6 +30,19 @@ class WidgetConfig:
     color: tuple[int, int, int] | None = None
     options: dict[str, Any] = field(default_factory=dict)
 
+    def __hash__(self) -> int:
+        """Hash all fields, with options converted to a hashable form."""
+        return hash(
+            (
+                self.widget_type,
+                self.slot,
+                self.entity_id,
+                self.label,
+                self.color,
+                make_hashable(self.options),
+            )
+        )
+
 
 class Widget(ABC):
     """Base class for all widgets.
@@ -54,6 +74,21 @@ class Widget(ABC):
             return [self.config.entity_id]
         return []
 
+    def state_key(self, state: WidgetState) -> Hashable | None:
+        """Return a hashable key for the rendered output of this widget.
+
+        Layouts reuse the previously rendered slot image while the key is
+        unchanged. Override in widgets whose output depends on more than the
+        entity/option state (e.g. the current time).
+
+        Args:
+            state: Widget state that will be passed to render()
+
+        Returns:
+            Hashable key, or None to always re-render
+        """
+        return state.cache_key()
+
     @abstractmethod
     def render(
         self,
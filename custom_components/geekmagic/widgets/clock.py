@@ -16,6 +16,8 @@ from .components import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from ..render_context import RenderContext
     from .state import WidgetState
 
@@ -161,17 +163,15 @@ class ClockWidget(Widget):
         """Clock widget doesn't depend on entities."""
         return []
 
-    def render(self, ctx: RenderContext, state: WidgetState) -> Component:
-        """Render the clock widget as a Component tree.
+    def _format_time(self, now: datetime) -> tuple[str, str | None, str | None]:
+        """Format the displayed strings for a point in time.
 
         Args:
-            ctx: RenderContext for drawing
-            state: Widget state with current time
-        """
-        # Get time from state (coordinator handles timezone)
-        now = state.now or datetime.now(tz=UTC)
+            now: Time to display
 
-        # Format time
+        Returns:
+            Tuple of (time_str, ampm, date_str)
+        """
         if self.show_seconds:
             if self.time_format == "12h":
                 time_str = now.strftime("%I:%M:%S")
@@ -187,6 +187,25 @@ class ClockWidget(Widget):
             ampm = None
 
         date_str = now.strftime("%a, %b %d") if self.show_date else None
+        return time_str, ampm, date_str
+
+    def state_key(self, state: WidgetState) -> Hashable | None:
+        """Key the rendered clock on the displayed strings, not the raw time."""
+        if state.now is None:
+            return None
+        return self._format_time(state.now)
+
+    def render(self, ctx: RenderContext, state: WidgetState) -> Component:
+        """Render the clock widget as a Component tree.
+
+        Args:
+            ctx: RenderContext for drawing
+            state: Widget state with current time
+        """
+        # Get time from state (coordinator handles timezone)
+        now = state.now or datetime.now(tz=UTC)
+
+        time_str, ampm, date_str = self._format_time(now)
         color = self.config.color or THEME_TEXT_PRIMARY
 
         return ClockDisplay(
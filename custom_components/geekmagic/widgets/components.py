@@ -81,7 +81,7 @@ def _to_align(align: Align) -> AlignItems:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Component(ABC):
     """Base class for all renderable components."""
 
@@ -147,13 +147,20 @@ class Text(Component):
         if text_width <= max_width:
             return text
         ellipsis = "…"
-        while len(text) > 1:
-            text = text[:-1]
-            test_text = text + ellipsis
+        # Binary search the longest prefix that fits (width grows with length),
+        # so long labels cost O(log n) measurements instead of one per char
+        best = ellipsis
+        low, high = 1, len(text) - 1
+        while low <= high:
+            mid = (low + high) // 2
+            test_text = text[:mid] + ellipsis
             text_width, _ = ctx.get_text_size(test_text, font)
             if text_width <= max_width:
-                return test_text
-        return ellipsis
+                best = test_text
+                low = mid + 1
+            else:
+                high = mid - 1
+        return best
 
     def render(self, ctx: RenderContext, x: int, y: int, width: int, height: int) -> None:
         font = ctx.get_font(self.font, bold=self.bold)
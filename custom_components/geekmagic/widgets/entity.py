@@ -60,15 +60,19 @@ class EntityWidget(Widget):
             unit = ""
             name = self.config.label or self.config.entity_id or PLACEHOLDER_NAME
         else:
+            # Bound once; the lookups below read attributes directly instead
+            # of going through the EntityState properties
+            attributes = entity.attributes
+            entity_id = entity.entity_id
             # Get value from attribute or state
             if self.attribute:
-                raw_value = entity.get(self.attribute)
+                raw_value = attributes.get(self.attribute)
                 value = str(raw_value) if raw_value is not None else PLACEHOLDER_VALUE
             else:
                 value = entity.state
                 # Translate binary sensor states (e.g., "on" -> "Open" for door sensors)
-                if entity.entity_id.startswith("binary_sensor."):
-                    value = translate_binary_state(value, entity.device_class)
+                if entity_id.startswith("binary_sensor."):
+                    value = translate_binary_state(value, attributes.get("device_class"))
             # Apply precision formatting if specified and value is numeric
             if self.precision is not None:
                 try:
@@ -76,8 +80,8 @@ class EntityWidget(Widget):
                     value = f"{numeric_value:.{self.precision}f}"
                 except (ValueError, TypeError):
                     pass  # Keep original value if not numeric
-            unit = entity.unit if self.show_unit else ""
-            name = self.config.label or entity.friendly_name or entity.entity_id
+            unit = attributes.get("unit_of_measurement", "") if self.show_unit else ""
+            name = self.config.label or attributes.get("friendly_name", entity_id) or entity_id
 
         # Build display value with unit
         value_text = f"{value}{unit}" if unit else value
@@ -2,30 +2,24 @@
 
 from __future__ import annotations
 
+import math
+from bisect import bisect_right
 from typing import TYPE_CHECKING
 
 from ..const import COLOR_DARK_GRAY
 from .base import Widget, WidgetConfig
 from .component_helpers import ArcGauge, BarGauge, RingGauge
 from .components import Component
-from .helpers import calculate_percent, format_value_with_unit
+from .helpers import calculate_percent, parse_float
 
 if TYPE_CHECKING:
     from ..render_context import RenderContext
     from .state import EntityState, WidgetState
 
 
-def _parse_float(value: object) -> float | None:
-    """Parse a numeric value, returning None on failure."""
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return None
-
-
 def _coerce_float(value: object, default: float) -> float:
     """Coerce a value to float with fallback default."""
-    parsed = _parse_float(value)
+    parsed = parse_float(value)
     if parsed is None:
         return default
     return parsed
@@ -33,10 +27,16 @@ def _coerce_float(value: object, default: float) -> float:
 
 def _coerce_precision(value: object, default: int = 2) -> int:
     """Coerce precision to an integer in [0, 6]."""
-    try:
-        precision = int(value)
-    except (ValueError, TypeError):
-        precision = default
+    if isinstance(value, int):
+        # Configs store precision as an in-range int; return it untouched
+        if 0 <= value <= 6:
+            return value
+        precision = value
+    else:
+        try:
+            precision = int(value)
+        except (ValueError, TypeError):
+            precision = default
     return max(0, min(6, precision))
 
 
@@ -45,7 +45,7 @@ def _extract_numeric(entity: EntityState | None, attribute: str | None = None) -
     if entity is None:
         return 0.0
     value = entity.get(attribute) if attribute else entity.state
-    parsed = _parse_float(value)
+    parsed = parse_float(value)
     if parsed is None:
         return 0.0
     return parsed
@@ -80,6 +80,8 @@ class GaugeWidget(Widget):
             else legacy_decimal_places
         )
         self.precision = _coerce_precision(precision_raw, default=2)
+        # Bound once; render formats every value with it
+        self._format_value = f"{{:.{self.precision}f}}".format
         # Backward-compatible alias used by tests/configs.
         self.decimal_places = self.precision
         self.unit = config.options.get("unit", "")
@@ -87,6 +89,20 @@ class GaugeWidget(Widget):
         self.attribute = config.options.get("attribute")
         # Color thresholds
         self.color_thresholds = config.options.get("color_thresholds", [])
+        # Parsed once, sorted by value (stable, so later entries win ties);
+        # thresholds without a color never match
+        parsed_thresholds = sorted(
+            (
+                (_coerce_float(threshold.get("value", 0), 0.0), tuple(threshold["color"]))
+                for threshold in self.color_thresholds
+                if threshold.get("color")
+            ),
+            key=lambda item: item[0],
+        )
+        self._threshold_values: tuple[float, ...] = tuple(v for v, _ in parsed_thresholds)
+        self._threshold_colors: tuple[tuple[int, int, int], ...] = tuple(
+            c for _, c in parsed_thresholds
+        )
 
     def get_entities(self) -> list[str]:
         """Return list of entity IDs this widget depends on."""
@@ -104,7 +120,7 @@ class GaugeWidget(Widget):
         fallback: float,
     ) -> float:
         """Resolve bound from template result/entity with static fallback."""
-        resolved_template_value = _parse_float(state.get_resolved_option(key))
+        resolved_template_value = parse_float(state.get_resolved_option(key))
         if resolved_template_value is not None:
             return resolved_template_value
 
@@ -113,28 +129,20 @@ class GaugeWidget(Widget):
         entity = state.get_entity(entity_id)
         if entity is None:
             return fallback
-        parsed = _parse_float(entity.state)
+        parsed = parse_float(entity.state)
         if parsed is None:
             return fallback
         return parsed
 
     def _get_threshold_color(self, value: float) -> tuple[int, int, int] | None:
         """Get color based on value and thresholds."""
-        if not self.color_thresholds:
+        if not self._threshold_values or math.isnan(value):
             return None
-
-        sorted_thresholds = sorted(
-            self.color_thresholds,
-            key=lambda t: _coerce_float(t.get("value", 0), 0.0),
-        )
-        matching_color = None
-        for threshold in sorted_thresholds:
-            threshold_value = _coerce_float(threshold.get("value", 0), 0.0)
-            threshold_color = threshold.get("color")
-            if value >= threshold_value and threshold_color:
-                matching_color = tuple(threshold_color)
-
-        return matching_color  # type: ignore[return-value]
+        # Highest threshold at or below the value
+        index = bisect_right(self._threshold_values, value) - 1
+        if index < 0:
+            return None
+        return self._threshold_colors[index]
 
     def render(self, ctx: RenderContext, state: WidgetState) -> Component:
         """Render the gauge widget.
@@ -150,11 +158,10 @@ class GaugeWidget(Widget):
 
         # Extract numeric value
         value = _extract_numeric(entity, self.attribute)
-        decimal_format = f"{{:.{self.precision}f}}"
-        display_value = decimal_format.format(value) if entity is not None else "--"
+        display_value = self._format_value(value) if entity is not None else "--"
 
         # Get unit from entity if not configured
-        unit = self.unit
+        unit = self.unit or ""
         if not unit and entity is not None:
             unit = entity.unit or ""
 
@@ -180,8 +187,8 @@ class GaugeWidget(Widget):
         threshold_color = self._get_threshold_color(value)
         color = threshold_color or self.config.color or ctx.theme.get_accent_color(self.config.slot)
 
-        # Format value with unit
-        value_text = format_value_with_unit(display_value, unit) if self.show_value else ""
+        # Value with unit appended directly (no separator or abbreviation here)
+        value_text = display_value + unit if self.show_value else ""
 
         if self.style == "ring":
             return RingGauge(
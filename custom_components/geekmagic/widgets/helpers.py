@@ -7,7 +7,7 @@ import json
 import logging
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from homeassistant.core import State
@@ -16,6 +16,53 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+
+def make_hashable(value: Any) -> Any:
+    """Convert nested dicts, lists and sets into hashable equivalents.
+
+    Dicts become frozensets of items, so equal dicts hash equally regardless
+    of key order. Used for cache keys built from config and state.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        Hashable equivalent of the value
+    """
+    if isinstance(value, dict):
+        return frozenset((k, make_hashable(v)) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(make_hashable(v) for v in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(make_hashable(v) for v in value)
+    return value
+
+
+def parse_float(value: object) -> float | None:
+    """Parse a float value, returning None on invalid input.
+
+    Numbers and common non-numeric HA states are handled without going
+    through float()'s exception path.
+
+    Args:
+        value: Value to parse (number, numeric string, or anything else)
+
+    Returns:
+        Parsed float, or None if the value is not numeric
+    """
+    if isinstance(value, str):
+        if value in _NON_NUMERIC_STATES:
+            return None
+    elif isinstance(value, int | float):
+        return float(value)
+    elif value is None:
+        return None
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (ValueError, TypeError):
+        return None
+
+
 # Path to HA icon JSON files
 _HA_ICONS_DIR = Path(__file__).parent.parent / "data" / "ha_icons"
 
@@ -23,6 +70,9 @@ _HA_ICONS_DIR = Path(__file__).parent.parent / "data" / "ha_icons"
 # Includes common affirmative states across different entity types
 ON_STATES = frozenset({"on", "true", "home", "locked", "open", "unlocked", "1"})
 
+# Common non-numeric states, rejected before float() raises on them
+_NON_NUMERIC_STATES = frozenset({"", "unknown", "unavailable", "none", "on", "off"})
+
 # Binary sensor device class state translations
 # Maps device_class to (on_state, off_state) display strings
 # Aligned with Home Assistant core: homeassistant/components/binary_sensor/strings.json
@@ -441,7 +491,13 @@ def calculate_percent(
     value_range = max_val - min_val
     if value_range <= 0:
         return 0.0
-    return max(0.0, min(100.0, ((value - min_val) / value_range) * 100))
+    percent = ((value - min_val) / value_range) * 100
+    # Comparisons instead of min()/max() calls; NaN still clamps to 100
+    if percent < 0.0:
+        return 0.0
+    if percent <= 100.0:
+        return percent
+    return 100.0
 
 
 def is_entity_on(state: State | None) -> bool:
@@ -460,7 +516,9 @@ def is_entity_on(state: State | None) -> bool:
     """
     if state is None:
         return False
-    return state.state.lower() in ON_STATES
+    value = state.state
+    # HA states are almost always lowercase already; only lowercase the rest
+    return value in ON_STATES or (not value.islower() and value.lower() in ON_STATES)
 
 
 def get_unit(state: State | None, default: str = "") -> str:
@@ -25,6 +25,8 @@ from .components import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from ..render_context import RenderContext
     from .state import EntityState, WidgetState
 
@@ -366,6 +368,10 @@ class MediaWidget(Widget):
         self.show_progress = config.options.get("show_progress", True)
         self.show_album_art = config.options.get("show_album_art", True)
 
+    def state_key(self, state: WidgetState) -> Hashable | None:
+        """Include the current time, which drives the playback position."""
+        return state.cache_key(include_now=True)
+
     def render(self, ctx: RenderContext, state: WidgetState) -> Component:
         """Render the media player widget.
 
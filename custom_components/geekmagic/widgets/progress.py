@@ -20,23 +20,18 @@ from .components import (
     Spacer,
     Text,
 )
+from .helpers import parse_float
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from ..render_context import RenderContext
     from .state import EntityState, WidgetState
 
 
-def _parse_float(value: object) -> float | None:
-    """Parse a float value, returning None on invalid input."""
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return None
-
-
 def _coerce_float(value: object, default: float) -> float:
     """Coerce a value to float with fallback."""
-    parsed = _parse_float(value)
+    parsed = parse_float(value)
     if parsed is None:
         return default
     return parsed
@@ -44,13 +39,23 @@ def _coerce_float(value: object, default: float) -> float:
 
 def _coerce_precision(value: object, default: int) -> int:
     """Coerce precision to an integer in [0, 6]."""
-    try:
-        precision = int(value)
-    except (ValueError, TypeError):
-        precision = default
+    if isinstance(value, int):
+        # Configs store precision as an in-range int; return it untouched
+        if 0 <= value <= 6:
+            return value
+        precision = value
+    else:
+        try:
+            precision = int(value)
+        except (ValueError, TypeError):
+            precision = default
     return max(0, min(6, precision))
 
 
+# Shared read-only stand-in for items without resolved template values
+_NO_RESOLVED_VALUES: dict[str, Any] = {}
+
+
 def _normalize_entity_id(value: object) -> str | None:
     """Normalize optional entity ID values."""
     if isinstance(value, str) and value:
@@ -58,8 +63,14 @@ def _normalize_entity_id(value: object) -> str | None:
     return None
 
 
+# Bound str.format callables for every precision _coerce_precision can return
+_FIXED_FORMATTERS = tuple(f"{{:.{precision}f}}".format for precision in range(7))
+
+
 def _format_fixed(value: float, precision: int) -> str:
     """Format a numeric value with fixed decimal places."""
+    if 0 <= precision <= 6:
+        return _FIXED_FORMATTERS[precision](value)
     return f"{value:.{precision}f}"
 
 
@@ -67,13 +78,13 @@ def _extract_numeric(entity: EntityState | None) -> float:
     """Extract numeric value from entity state."""
     if entity is None:
         return 0.0
-    parsed = _parse_float(entity.state)
+    parsed = parse_float(entity.state)
     if parsed is None:
         return 0.0
     return parsed
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressDisplay(Component):
     """Progress bar display component."""
 
@@ -116,143 +127,188 @@ class ProgressDisplay(Component):
         # Compact: MICRO cells in dense grids
         # Standard: TINY/SMALL cells, horizontal layout
         # Expanded: MEDIUM/LARGE cells, vertical layout with icon/label separate from value
-        size = get_size_category(height)
-        is_compact = size == SizeCategory.MICRO
-        is_expanded = size in (SizeCategory.MEDIUM, SizeCategory.LARGE)
-
-        if is_expanded:
-            # Expanded: icon + label on top, value below, bar + percent at bottom
-            icon_size = max(16, int(height * 0.18))
-
-            # Row 1: Icon + Label (centered)
-            header_children: list[Component] = []
-            if self.icon:
-                header_children.append(Icon(name=self.icon, size=icon_size, color=self.color))
-            header_children.append(
-                Text(text=label_text, font="small", color=THEME_TEXT_SECONDARY, align="center")
-            )
-
-            # Row 2: Value (centered, larger)
-            value_row = Row(
-                children=[
-                    Text(text=value_text, font="large", color=THEME_TEXT_PRIMARY, align="center")
-                ],
-                justify="center",
-                padding=padding,
-            )
+        build = self._LAYOUT_BUILDERS[get_size_category(height)]
+        build(
+            self,
+            ctx,
+            width,
+            height,
+            padding=padding,
+            bar_height=bar_height,
+            value_text=value_text,
+            label_text=label_text,
+            percent=percent,
+        ).render(ctx, x, y, width, height)
 
-            # Row 3: Bar + Percent
-            bar_row = Row(
-                children=[
-                    Bar(
-                        percent=percent,
-                        color=self.color,
-                        background=COLOR_DARK_GRAY,
-                        height=bar_height,
-                    ),
-                    Text(
-                        text=f"{percent:.0f}%", font="small", color=THEME_TEXT_PRIMARY, align="end"
-                    ),
-                ],
-                gap=8,
-                align="center",
-                padding=padding,
-            )
+    def _build_expanded(
+        self,
+        ctx: RenderContext,
+        width: int,
+        height: int,
+        *,
+        padding: int,
+        bar_height: int,
+        value_text: str,
+        label_text: str,
+        percent: float,
+    ) -> Component:
+        """Build the expanded layout: icon + label, value, then bar + percent."""
+        icon_size = max(16, int(height * 0.18))
+
+        # Row 1: Icon + Label (centered)
+        header_children: list[Component] = []
+        if self.icon:
+            header_children.append(Icon(name=self.icon, size=icon_size, color=self.color))
+        header_children.append(
+            Text(text=label_text, font="small", color=THEME_TEXT_SECONDARY, align="center")
+        )
 
-            Column(
-                children=[
-                    Row(children=header_children, gap=6, justify="center", padding=padding),
-                    value_row,
-                    bar_row,
-                ],
-                gap=int(height * 0.06),
-                justify="center",
-                align="stretch",
-            ).render(ctx, x, y, width, height)
-
-        elif is_compact:
-            # Compact: icon + value on first line, bar + percent on second
-            icon_size = max(10, int(height * 0.20))
-
-            row1_children: list[Component] = []
-            if self.icon:
-                row1_children.append(Icon(name=self.icon, size=icon_size, color=self.color))
-            row1_children.append(
-                Text(text=value_text, font="small", color=THEME_TEXT_PRIMARY, align="start")
-            )
+        # Row 2: Value (centered, larger)
+        value_row = Row(
+            children=[
+                Text(text=value_text, font="large", color=THEME_TEXT_PRIMARY, align="center")
+            ],
+            justify="center",
+            padding=padding,
+        )
 
-            row2_children: list[Component] = [
+        # Row 3: Bar + Percent
+        bar_row = Row(
+            children=[
                 Bar(
                     percent=percent,
                     color=self.color,
                     background=COLOR_DARK_GRAY,
                     height=bar_height,
                 ),
-                Text(text=f"{percent:.0f}%", font="tiny", color=THEME_TEXT_PRIMARY, align="end"),
-            ]
+                Text(text=f"{percent:.0f}%", font="small", color=THEME_TEXT_PRIMARY, align="end"),
+            ],
+            gap=8,
+            align="center",
+            padding=padding,
+        )
 
-            Column(
-                children=[
-                    Row(children=row1_children, gap=4, align="center", padding=padding),
-                    Row(children=row2_children, gap=8, align="center", padding=padding),
-                ],
-                gap=int(height * 0.10),
-                justify="center",
-                align="stretch",
-            ).render(ctx, x, y, width, height)
+        return Column(
+            children=[
+                Row(children=header_children, gap=6, justify="center", padding=padding),
+                value_row,
+                bar_row,
+            ],
+            gap=int(height * 0.06),
+            justify="center",
+            align="stretch",
+        )
+
+    def _build_compact(
+        self,
+        ctx: RenderContext,
+        width: int,
+        height: int,
+        *,
+        padding: int,
+        bar_height: int,
+        value_text: str,
+        label_text: str,
+        percent: float,
+    ) -> Component:
+        """Build the compact layout: icon + value, then bar + percent."""
+        icon_size = max(10, int(height * 0.20))
+
+        row1_children: list[Component] = []
+        if self.icon:
+            row1_children.append(Icon(name=self.icon, size=icon_size, color=self.color))
+        row1_children.append(
+            Text(text=value_text, font="small", color=THEME_TEXT_PRIMARY, align="start")
+        )
+
+        row2_children: list[Component] = [
+            Bar(
+                percent=percent,
+                color=self.color,
+                background=COLOR_DARK_GRAY,
+                height=bar_height,
+            ),
+            Text(text=f"{percent:.0f}%", font="tiny", color=THEME_TEXT_PRIMARY, align="end"),
+        ]
+
+        return Column(
+            children=[
+                Row(children=row1_children, gap=4, align="center", padding=padding),
+                Row(children=row2_children, gap=8, align="center", padding=padding),
+            ],
+            gap=int(height * 0.10),
+            justify="center",
+            align="stretch",
+        )
 
+    def _build_standard(
+        self,
+        ctx: RenderContext,
+        width: int,
+        height: int,
+        *,
+        padding: int,
+        bar_height: int,
+        value_text: str,
+        label_text: str,
+        percent: float,
+    ) -> Component:
+        """Build the standard layout: icon + label + value, then bar + percent."""
+        icon_size = max(10, int(height * 0.20))
+
+        top_row_children: list[Component] = []
+        if self.icon:
+            top_row_children.append(Icon(name=self.icon, size=icon_size, color=self.color))
+
+        # Check if label fits by measuring
+        font_label = ctx.get_font("small")
+        font_value = ctx.get_font("regular")
+        label_width, _ = ctx.get_text_size(label_text, font_label)
+        value_width, _ = ctx.get_text_size(value_text, font_value)
+        icon_width = icon_size + 4 if self.icon else 0
+        available_for_label = width - padding * 2 - icon_width - value_width - 8
+
+        if available_for_label >= label_width:
+            top_row_children.extend(
+                [
+                    Text(text=label_text, font="small", color=THEME_TEXT_SECONDARY, align="start"),
+                    Spacer(),
+                    Text(text=value_text, font="regular", color=THEME_TEXT_PRIMARY, align="end"),
+                ]
+            )
         else:
-            # Standard: icon + label + value on first line, bar + percent on second
-            icon_size = max(10, int(height * 0.20))
-
-            top_row_children: list[Component] = []
-            if self.icon:
-                top_row_children.append(Icon(name=self.icon, size=icon_size, color=self.color))
-
-            # Check if label fits by measuring
-            font_label = ctx.get_font("small")
-            font_value = ctx.get_font("regular")
-            label_width, _ = ctx.get_text_size(label_text, font_label)
-            value_width, _ = ctx.get_text_size(value_text, font_value)
-            icon_width = icon_size + 4 if self.icon else 0
-            available_for_label = width - padding * 2 - icon_width - value_width - 8
-
-            if available_for_label >= label_width:
-                top_row_children.extend(
-                    [
-                        Text(
-                            text=label_text, font="small", color=THEME_TEXT_SECONDARY, align="start"
-                        ),
-                        Spacer(),
-                        Text(
-                            text=value_text, font="regular", color=THEME_TEXT_PRIMARY, align="end"
-                        ),
-                    ]
-                )
-            else:
-                top_row_children.append(
-                    Text(text=value_text, font="regular", color=THEME_TEXT_PRIMARY, align="start")
-                )
+            top_row_children.append(
+                Text(text=value_text, font="regular", color=THEME_TEXT_PRIMARY, align="start")
+            )
 
-            bottom_row_children: list[Component] = [
-                Bar(
-                    percent=percent,
-                    color=self.color,
-                    background=COLOR_DARK_GRAY,
-                    height=bar_height,
-                ),
-                Text(text=f"{percent:.0f}%", font="small", color=THEME_TEXT_PRIMARY, align="end"),
-            ]
+        bottom_row_children: list[Component] = [
+            Bar(
+                percent=percent,
+                color=self.color,
+                background=COLOR_DARK_GRAY,
+                height=bar_height,
+            ),
+            Text(text=f"{percent:.0f}%", font="small", color=THEME_TEXT_PRIMARY, align="end"),
+        ]
+
+        return Column(
+            children=[
+                Row(children=top_row_children, gap=4, align="center", padding=padding),
+                Row(children=bottom_row_children, gap=8, align="center", padding=padding),
+            ],
+            gap=int(height * 0.10),
+            justify="center",
+            align="stretch",
+        )
 
-            Column(
-                children=[
-                    Row(children=top_row_children, gap=4, align="center", padding=padding),
-                    Row(children=bottom_row_children, gap=8, align="center", padding=padding),
-                ],
-                gap=int(height * 0.10),
-                justify="center",
-                align="stretch",
-            ).render(ctx, x, y, width, height)
+    # Layout builder per size category, picked with one lookup per render
+    _LAYOUT_BUILDERS: ClassVar[dict[SizeCategory, Callable[..., Component]]] = {
+        SizeCategory.MICRO: _build_compact,
+        SizeCategory.TINY: _build_standard,
+        SizeCategory.SMALL: _build_standard,
+        SizeCategory.MEDIUM: _build_expanded,
+        SizeCategory.LARGE: _build_expanded,
+    }
 
 
 class ProgressWidget(Widget):
@@ -278,7 +334,7 @@ class ProgressWidget(Widget):
 
     def _resolve_target(self, state: WidgetState) -> float:
         """Resolve target from template/entity/static options."""
-        resolved_target = _parse_float(state.get_resolved_option("target"))
+        resolved_target = parse_float(state.get_resolved_option("target"))
         if resolved_target is not None:
             return resolved_target
 
@@ -289,7 +345,7 @@ class ProgressWidget(Widget):
         if target_entity is None:
             return self.target
 
-        parsed = _parse_float(target_entity.state)
+        parsed = parse_float(target_entity.state)
         if parsed is None:
             return self.target
         return parsed
@@ -322,7 +378,7 @@ class ProgressWidget(Widget):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiProgressDisplay(Component):
     """Multi-progress list display component."""
 
@@ -369,7 +425,8 @@ class MultiProgressDisplay(Component):
             label = item.get("label", "Item")
             value = item.get("value", 0)
             target = item.get("target", 100)
-            color = item.get("color", ctx.theme.get_accent_color(i))
+            # Only look up the accent when the item has no color of its own
+            color = item["color"] if "color" in item else ctx.theme.get_accent_color(i)
             icon = item.get("icon")
             unit = item.get("unit", "")
             precision = _coerce_precision(item.get("precision", self.precision), self.precision)
@@ -433,15 +490,16 @@ class MultiProgressWidget(Widget):
 
     def get_entities(self) -> list[str]:
         """Return list of entity IDs."""
-        entities: list[str] = []
+        # Ordered dedup in one dict instead of a list scan per item
+        entities: dict[str, None] = {}
         for item in self.items:
             entity_id = _normalize_entity_id(item.get("entity_id"))
-            if entity_id and entity_id not in entities:
-                entities.append(entity_id)
+            if entity_id:
+                entities[entity_id] = None
             target_entity = _normalize_entity_id(item.get("target_entity"))
-            if target_entity and target_entity not in entities:
-                entities.append(target_entity)
-        return entities
+            if target_entity:
+                entities[target_entity] = None
+        return list(entities)
 
     def _resolve_item_target(
         self,
@@ -451,7 +509,7 @@ class MultiProgressWidget(Widget):
         template_value: object | None = None,
     ) -> float:
         """Resolve item target from template/entity/static options."""
-        parsed_template = _parse_float(template_value)
+        parsed_template = parse_float(template_value)
         if parsed_template is not None:
             return parsed_template
 
@@ -460,23 +518,11 @@ class MultiProgressWidget(Widget):
         target_entity = state.get_entity(target_entity_id)
         if target_entity is None:
             return fallback
-        parsed = _parse_float(target_entity.state)
+        parsed = parse_float(target_entity.state)
         if parsed is None:
             return fallback
         return parsed
 
-    def _get_resolved_item_values(self, state: WidgetState, index: int) -> dict[str, Any]:
-        """Get resolved template values for a multi-progress item by index."""
-        resolved_items = state.get_resolved_option("items")
-        if not isinstance(resolved_items, list):
-            return {}
-        if index < 0 or index >= len(resolved_items):
-            return {}
-        resolved_item = resolved_items[index]
-        if not isinstance(resolved_item, dict):
-            return {}
-        return resolved_item
-
     def render(self, ctx: RenderContext, state: WidgetState) -> Component:
         """Render the multi-progress widget."""
         resolved_title_present = "title" in state.resolved_options
@@ -487,9 +533,18 @@ class MultiProgressWidget(Widget):
             else self.title
         )
 
+        # Resolved template values per item index, fetched once for all items
+        resolved_items = state.get_resolved_option("items")
+        if not isinstance(resolved_items, list):
+            resolved_items = []
+        resolved_count = len(resolved_items)
+
+        theme = ctx.theme
         display_items = []
         for i, item in enumerate(self.items):
-            resolved_item = self._get_resolved_item_values(state, i)
+            resolved_item = resolved_items[i] if i < resolved_count else None
+            if not isinstance(resolved_item, dict):
+                resolved_item = _NO_RESOLVED_VALUES
 
             entity_id = _normalize_entity_id(item.get("entity_id"))
             entity = state.get_entity(entity_id) if entity_id else None
@@ -521,7 +576,7 @@ class MultiProgressWidget(Widget):
                     "label": label,
                     "value": value,
                     "target": target,
-                    "color": item.get("color", ctx.theme.get_accent_color(i)),
+                    "color": item["color"] if "color" in item else theme.get_accent_color(i),
                     "icon": item.get("icon"),
                     "unit": unit,
                     "precision": self.precision,
@@ -9,7 +9,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from .helpers import make_hashable
+
 if TYPE_CHECKING:
+    from collections.abc import Hashable
     from datetime import datetime
 
     from PIL import Image
@@ -50,6 +53,10 @@ class EntityState:
         """Get attribute value."""
         return self.attributes.get(key, default)
 
+    def cache_key(self) -> tuple[Any, ...]:
+        """Get a hashable snapshot of this entity state."""
+        return (self.entity_id, self.state, make_hashable(self.attributes))
+
 
 @dataclass(frozen=True)
 class WidgetState:
@@ -97,3 +104,34 @@ class WidgetState:
     def get_resolved_option(self, key: str, default: Any = None) -> Any:
         """Get a pre-resolved dynamic option value."""
         return self.resolved_options.get(key, default)
+
+    def cache_key(self, include_now: bool = False) -> Hashable | None:
+        """Get a hashable key identifying the rendered output of this state.
+
+        Two states with equal keys render identically, so the rendered slot
+        can be reused. The current time is excluded unless requested, since
+        most widgets do not display it.
+
+        Args:
+            include_now: Whether the widget output depends on the current time
+
+        Returns:
+            Hashable key, or None if the state cannot be cached (e.g. it
+            carries an image or unhashable attribute values)
+        """
+        if self.image is not None:
+            return None
+
+        key = (
+            self.entity.cache_key() if self.entity else None,
+            tuple(entity.cache_key() for entity in self.entities.values()),
+            make_hashable(self.resolved_options),
+            tuple(self.history),
+            make_hashable(self.forecast),
+            self.now if include_now else None,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
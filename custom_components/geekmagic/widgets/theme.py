@@ -21,8 +21,18 @@ Color = tuple[int, int, int]
 BorderStyle = Literal["none", "solid", "outline", "double"]
 FontWeight = Literal["light", "regular"]
 
+# Default accent palette; a tuple, so it is shared safely as a field default
+_DEFAULT_ACCENT_COLORS: tuple[Color, ...] = (
+    (27, 158, 119),  # Teal
+    (217, 95, 2),  # Orange
+    (117, 112, 179),  # Lavender
+    (231, 41, 138),  # Magenta
+    (102, 166, 30),  # Lime
+    (230, 171, 2),  # Gold
+)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Theme:
     """Theme configuration affecting all visual aspects.
 
@@ -68,16 +78,7 @@ class Theme:
     text_on_primary: Color = (255, 255, 255)
 
     # Accent color palette for widgets (cycles through for variety)
-    accent_colors: tuple[Color, ...] = field(
-        default_factory=lambda: (
-            (27, 158, 119),  # Teal
-            (217, 95, 2),  # Orange
-            (117, 112, 179),  # Lavender
-            (231, 41, 138),  # Magenta
-            (102, 166, 30),  # Lime
-            (230, 171, 2),  # Gold
-        )
-    )
+    accent_colors: tuple[Color, ...] = _DEFAULT_ACCENT_COLORS
 
     # Shape styling
     corner_radius: int = 8
@@ -101,9 +102,16 @@ class Theme:
     # Progress/gauge bar styling
     bar_background: Color = (50, 50, 50)
 
+    # Palette size, derived from accent_colors (kept out of __eq__/__hash__)
+    _accent_count: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache the palette size used by get_accent_color."""
+        object.__setattr__(self, "_accent_count", len(self.accent_colors))
+
     def get_accent_color(self, index: int) -> Color:
         """Get accent color for a slot index, cycling through available colors."""
-        return self.accent_colors[index % len(self.accent_colors)]
+        return self.accent_colors[index % self._accent_count]
 
 
 # =============================================================================
@@ -660,17 +668,25 @@ THEMES: dict[str, Theme] = {
 
 DEFAULT_THEME = THEME_CLASSIC
 
+# Case-insensitive index for names that don't match a registry key exactly
+_THEMES_BY_FOLDED_NAME: dict[str, Theme] = {key.casefold(): theme for key, theme in THEMES.items()}
+
 
 def get_theme(name: str) -> Theme:
     """Get a theme by name.
 
+    Matching ignores case and surrounding whitespace.
+
     Args:
         name: Theme name
 
     Returns:
         Theme instance, defaults to classic if name not found
     """
-    return THEMES.get(name, DEFAULT_THEME)
+    theme = THEMES.get(name)
+    if theme is not None:
+        return theme
+    return _THEMES_BY_FOLDED_NAME.get(name.strip().casefold(), DEFAULT_THEME)
 
 
 __all__ = [
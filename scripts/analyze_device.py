@@ -18,6 +18,7 @@ import json
 import re
 import sys
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from urllib.error import URLError
 
 # Known pages on GeekMagic devices
@@ -33,21 +34,42 @@ PAGES = [
 ]
 
 # Known JSON endpoints
-JSON_ENDPOINTS = [
-    "/v.json",
-    "/app.json",
-    "/brt.json",
-    "/space.json",
-    "/delay.json",
-    "/album.json",
-    "/city.json",
-    "/dst.json",
-    "/day.json",
-    "/font.json",
-    "/colon.json",
-    "/config.json",
-    "/timebrt.json",
+JSON_ENDPOINTS = frozenset(
+    {
+        "/v.json",
+        "/app.json",
+        "/brt.json",
+        "/space.json",
+        "/delay.json",
+        "/album.json",
+        "/city.json",
+        "/dst.json",
+        "/day.json",
+        "/font.json",
+        "/colon.json",
+        "/config.json",
+        "/timebrt.json",
+    }
+)
+
+# The device's embedded web server only handles a few connections at once
+MAX_CONCURRENT_FETCHES = 4
+
+# Patterns used to discover endpoints in fetched HTML/JS
+JSON_ENDPOINT_PATTERNS = [
+    re.compile(r"getData\(['\"]/?([^'\"]+\.json)['\"]"),
+    re.compile(r"getJSON\(['\"]/?([^'\"]+\.json)['\"]"),
+    re.compile(r"\.get\(['\"]/?([^'\"]+\.json)['\"]"),
+    re.compile(r"\.open\(['\"][A-Z]+['\"],\s*['\"]/?([^'\"]+\.json)['\"]"),
 ]
+SET_PARAM_PATTERN = re.compile(r"/set\?([^\"'&\s]+)")
+API_PATH_PATTERNS = [
+    re.compile(r'action=["\']([^"\']+)["\']'),
+    re.compile(r"url\s*[:=]\s*['\"]([^'\"]+)['\"]"),
+]
+
+# Static assets excluded from the discovered API paths
+STATIC_FILE_EXTENSIONS = (".html", ".js", ".css", ".json")
 
 
 def fetch(url: str) -> str | None:
@@ -58,10 +80,15 @@ def fetch(url: str) -> str | None:
     try:
         req = urllib.request.Request(url, headers={"Accept-Encoding": "gzip, deflate"})  # noqa: S310
         with urllib.request.urlopen(req, timeout=10) as resp:  # noqa: S310
-            data = resp.read()
-            # Handle gzip
-            if data[:2] == b"\x1f\x8b":
-                data = gzip.decompress(data)
+            if resp.headers.get("Content-Encoding") == "gzip":
+                # Decompress while reading instead of buffering the raw body
+                with gzip.GzipFile(fileobj=resp) as stream:
+                    data = stream.read()
+            else:
+                data = resp.read()
+                # Some firmware serves pre-gzipped files without the header
+                if data[:2] == b"\x1f\x8b":
+                    data = gzip.decompress(data)
             return data.decode("utf-8", errors="ignore")
     except (URLError, TimeoutError):
         return None
@@ -69,56 +96,43 @@ def fetch(url: str) -> str | None:
 
 def extract_json_endpoints(content: str) -> set[str]:
     """Extract JSON endpoint references from HTML/JS."""
-    patterns = [
-        r"getData\(['\"]/?([^'\"]+\.json)['\"]",
-        r"getJSON\(['\"]/?([^'\"]+\.json)['\"]",
-        r"\.get\(['\"]/?([^'\"]+\.json)['\"]",
-        r"\.open\(['\"][A-Z]+['\"],\s*['\"]/?([^'\"]+\.json)['\"]",
-    ]
     endpoints = set()
-    for pattern in patterns:
-        for match in re.finditer(pattern, content):
+    for pattern in JSON_ENDPOINT_PATTERNS:
+        for match in pattern.finditer(content):
             endpoints.add("/" + match.group(1).lstrip("/"))
     return endpoints
 
 
 def extract_set_params(content: str) -> set[str]:
     """Extract /set?param=value API parameters."""
-    pattern = r"/set\?([^\"'&\s]+)"
     params = set()
-    for match in re.finditer(pattern, content):
+    for match in SET_PARAM_PATTERN.finditer(content):
         query = match.group(1)
         for part in query.split("&"):
-            if "=" in part:
-                params.add(part.split("=")[0])
-            else:
-                params.add(part.split("+")[0])
+            name, sep, _ = part.partition("=")
+            params.add(name if sep else part.partition("+")[0])
     return params
 
 
 def extract_api_paths(content: str) -> set[str]:
     """Extract API paths like /doUpload, /delete, /wifisave, etc."""
-    patterns = [
-        r'action=["\']([^"\']+)["\']',
-        r"url\s*[:=]\s*['\"]([^'\"]+)['\"]",
-    ]
     paths = set()
-    for pattern in patterns:
-        for match in re.finditer(pattern, content):
+    for pattern in API_PATH_PATTERNS:
+        for match in pattern.finditer(content):
             path = match.group(1)
-            if path.startswith("/") and not any(
-                path.endswith(ext) for ext in [".html", ".js", ".css", ".json"]
-            ):
+            if path.startswith("/") and not path.endswith(STATIC_FILE_EXTENSIONS):
                 paths.add(path.split("?")[0])
     return paths
 
 
 def analyze_json(content: str) -> dict | None:
     """Parse JSON and return field types."""
-    if not content or content.strip() == "404":
+    content = content.strip()
+    # Only objects are analyzed; skips "404" bodies and HTML error pages
+    if not content.startswith("{"):
         return None
     try:
-        data = json.loads(content.strip())
+        data = json.loads(content)
         if isinstance(data, dict):
             return {k: type(v).__name__ for k, v in data.items()}
     except json.JSONDecodeError:
@@ -140,17 +154,18 @@ def main():
 
     # Fetch pages
     print("\nFetching pages...")
-    all_content = ""
-    for page in PAGES:
-        url = base_url + page
-        content = fetch(url)
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+        pages = list(executor.map(fetch, [base_url + page for page in PAGES]))
+    content_parts: list[str] = []
+    for page, content in zip(PAGES, pages, strict=True):
         if content:
-            all_content += content
+            content_parts.append(content)
             print(f"  {page} - OK")
         else:
             print(f"  {page} - N/A")
 
     # Extract endpoints from HTML/JS
+    all_content = "".join(content_parts)
     discovered_json = extract_json_endpoints(all_content)
     set_params = extract_set_params(all_content)
     api_paths = extract_api_paths(all_content)
@@ -158,45 +173,45 @@ def main():
     # Fetch JSON endpoints
     print("\nFetching JSON endpoints...")
     json_structures: dict[str, dict] = {}
-    all_json = set(JSON_ENDPOINTS) | discovered_json
+    all_json = JSON_ENDPOINTS | discovered_json
 
-    for endpoint in sorted(all_json):
-        url = base_url + endpoint
-        content = fetch(url)
+    endpoints = sorted(all_json)
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+        responses = list(executor.map(fetch, [base_url + endpoint for endpoint in endpoints]))
+    for endpoint, content in zip(endpoints, responses, strict=True):
         if content and (structure := analyze_json(content)):
             json_structures[endpoint] = structure
             print(f"  {endpoint} - OK")
         else:
             print(f"  {endpoint} - N/A")
 
-    # Output analysis
-    print("\n" + "=" * 60)
-    print("API Analysis Results")
-    print("=" * 60)
+    # Output analysis, written in one go once everything is collected
+    report = ["", "=" * 60, "API Analysis Results", "=" * 60]
 
-    print("\n## JSON Endpoints")
-    for ep in sorted(all_json):
+    report.append("\n## JSON Endpoints")
+    for ep in endpoints:
         marker = "[OK]" if ep in json_structures else "[N/A]"
-        print(f"  GET {ep} {marker}")
+        report.append(f"  GET {ep} {marker}")
 
-    print("\n## /set API Parameters")
-    for param in sorted(set_params):
-        print(f"  /set?{param}=<value>")
+    report.append("\n## /set API Parameters")
+    report.extend(f"  /set?{param}=<value>" for param in sorted(set_params))
 
-    print("\n## Other API Endpoints")
-    for path in sorted(api_paths):
-        print(f"  {path}")
+    report.append("\n## Other API Endpoints")
+    report.extend(f"  {path}" for path in sorted(api_paths))
 
     if json_structures:
-        print("\n## JSON Response Structures")
+        report.append("\n## JSON Response Structures")
         for endpoint, fields in sorted(json_structures.items()):
-            print(f"\n  {endpoint}:")
-            for key, typ in fields.items():
-                print(f"    {key}: {typ}")
-
-    print("\n" + "=" * 60)
-    print("Share this output when reporting device compatibility issues")
-    print("=" * 60)
+            report.append(f"\n  {endpoint}:")
+            report.extend(f"    {key}: {typ}" for key, typ in fields.items())
+
+    report += [
+        "",
+        "=" * 60,
+        "Share this output when reporting device compatibility issues",
+        "=" * 60,
+    ]
+    print("\n".join(report))
 
 
 if __name__ == "__main__":
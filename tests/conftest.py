@@ -1,11 +1,5 @@
 """Test fixtures for GeekMagic integration."""
 
-import sys
-from pathlib import Path
-
-# Add custom_components to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
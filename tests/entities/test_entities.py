@@ -119,7 +119,6 @@ class TestDisplaySelectCoordinatorUpdate:
         # Call count should not have increased despite 10 updates
         assert select.async_write_ha_state.call_count == initial_call_count
 
-    @pytest.mark.asyncio
     async def test_state_written_after_user_selection(self, mock_coordinator, mock_hass):
         """Test that state IS written after explicit user selection."""
         from custom_components.geekmagic.entities.select import GeekMagicDisplaySelect
@@ -134,7 +133,6 @@ class TestDisplaySelectCoordinatorUpdate:
         # State should be written after user selection
         select.async_write_ha_state.assert_called()
 
-    @pytest.mark.asyncio
     async def test_state_written_after_custom_view_selection(self, mock_coordinator, mock_hass):
         """Test that state is written when user selects a custom view."""
         from custom_components.geekmagic.entities.select import GeekMagicDisplaySelect
@@ -193,7 +191,6 @@ class TestViewCyclingSwitchIsOn:
 class TestViewCyclingSwitchTurnOn:
     """Tests for ViewCyclingSwitch async_turn_on."""
 
-    @pytest.mark.asyncio
     async def test_turn_on_sets_default_interval_when_no_previous(
         self, mock_coordinator, mock_hass
     ):
@@ -217,7 +214,6 @@ class TestViewCyclingSwitchTurnOn:
         new_options = call_kwargs.kwargs.get("options") or call_kwargs[1].get("options")
         assert new_options[CONF_SCREEN_CYCLE_INTERVAL] == DEFAULT_CYCLE_ON_INTERVAL
 
-    @pytest.mark.asyncio
     async def test_turn_on_restores_previous_interval(self, mock_coordinator, mock_hass):
         """Test async_turn_on restores previous interval after turn_off/turn_on cycle."""
         from custom_components.geekmagic.entities.switch import GeekMagicViewCyclingSwitch
@@ -244,7 +240,6 @@ class TestViewCyclingSwitchTurnOn:
         new_options = call_kwargs.kwargs.get("options") or call_kwargs[1].get("options")
         assert new_options[CONF_SCREEN_CYCLE_INTERVAL] == 45
 
-    @pytest.mark.asyncio
     async def test_turn_on_is_noop_when_already_on(self, mock_coordinator, mock_hass):
         """Test async_turn_on is no-op when already on."""
         from custom_components.geekmagic.entities.switch import GeekMagicViewCyclingSwitch
@@ -264,7 +259,6 @@ class TestViewCyclingSwitchTurnOn:
 class TestViewCyclingSwitchTurnOff:
     """Tests for ViewCyclingSwitch async_turn_off."""
 
-    @pytest.mark.asyncio
     async def test_turn_off_sets_interval_to_zero(self, mock_coordinator, mock_hass):
         """Test async_turn_off sets interval to 0 and stores previous value."""
         from custom_components.geekmagic.entities.switch import GeekMagicViewCyclingSwitch
@@ -286,7 +280,6 @@ class TestViewCyclingSwitchTurnOff:
         # Should store previous interval
         assert switch._last_interval == 60
 
-    @pytest.mark.asyncio
     async def test_turn_off_is_noop_when_already_off(self, mock_coordinator, mock_hass):
         """Test async_turn_off is no-op when already off."""
         from custom_components.geekmagic.entities.switch import GeekMagicViewCyclingSwitch
@@ -329,3 +322,55 @@ class TestViewCyclingSwitchAttributes:
         switch = GeekMagicViewCyclingSwitch(mock_coordinator)
 
         assert switch._attr_unique_id == "test_entry_123_view_cycling"
+
+
+class TestPreviewImageCoordinatorUpdate:
+    """Tests for preview image entity _handle_coordinator_update behavior."""
+
+    def _make_image(self, mock_hass, mock_coordinator):
+        from custom_components.geekmagic.image import GeekMagicPreviewImage
+
+        entry = MagicMock()
+        entry.data = {"host": "192.168.1.100"}
+        mock_coordinator.last_image = None
+        mock_coordinator.preview_just_updated = False
+        image = GeekMagicPreviewImage(mock_hass, mock_coordinator, entry)
+        image.async_write_ha_state = MagicMock()
+        return image
+
+    def test_state_written_for_new_preview(self, mock_hass, mock_coordinator):
+        """Test that a newly rendered preview is announced once."""
+        image = self._make_image(mock_hass, mock_coordinator)
+        mock_coordinator.last_image = b"png-1"
+        mock_coordinator.preview_just_updated = True
+
+        image._handle_coordinator_update()
+
+        image.async_write_ha_state.assert_called_once()
+        assert image.image_last_updated is not None
+
+    def test_state_not_rewritten_for_same_preview(self, mock_hass, mock_coordinator):
+        """Test repeated listener calls for the same image object don't write state."""
+        image = self._make_image(mock_hass, mock_coordinator)
+        mock_coordinator.last_image = b"png-1"
+        mock_coordinator.preview_just_updated = True
+
+        image._handle_coordinator_update()
+        image._handle_coordinator_update()
+        image._handle_coordinator_update()
+
+        image.async_write_ha_state.assert_called_once()
+
+        mock_coordinator.last_image = b"png-2"
+        image._handle_coordinator_update()
+
+        assert image.async_write_ha_state.call_count == 2
+
+    def test_state_not_written_on_periodic_refresh(self, mock_hass, mock_coordinator):
+        """Test periodic refreshes (preview not updated) don't write state."""
+        image = self._make_image(mock_hass, mock_coordinator)
+        mock_coordinator.last_image = b"png-1"
+
+        image._handle_coordinator_update()
+
+        image.async_write_ha_state.assert_not_called()
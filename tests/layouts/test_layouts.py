@@ -1,11 +1,5 @@
 """Tests for layout classes."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-
 import pytest
 
 from custom_components.geekmagic.layouts.base import Slot
@@ -44,6 +38,11 @@ class TestSlot:
         assert slot.rect == (10, 10, 100, 100)
         assert slot.widget is None
 
+    def test_slot_uses_slots(self):
+        """Test that Slot stores fields in __slots__ instead of a __dict__."""
+        slot = Slot(index=0, rect=(10, 10, 100, 100))
+        assert not hasattr(slot, "__dict__")
+
     def test_slot_with_widget(self):
         """Test creating a slot with a widget."""
         config = WidgetConfig(widget_type="clock", slot=0)
@@ -362,3 +361,151 @@ class TestLayoutEntityTracking:
         assert "sensor.temp" in entities
         assert "sensor.humidity" in entities
         assert len(entities) == 2
+
+
+class TestLayoutTileCache:
+    """Tests for reuse of rendered slot images."""
+
+    @staticmethod
+    def _entity_layout():
+        from custom_components.geekmagic.widgets.entity import EntityWidget
+
+        layout = Grid2x2()
+        config = WidgetConfig(widget_type="entity", slot=0, entity_id="sensor.temp")
+        layout.set_widget(0, EntityWidget(config))
+        return layout
+
+    @staticmethod
+    def _states(value: str):
+        from custom_components.geekmagic.widgets.state import EntityState, WidgetState
+
+        entity = EntityState(
+            entity_id="sensor.temp", state=value, attributes={"unit_of_measurement": "°C"}
+        )
+        return {0: WidgetState(entity=entity)}
+
+    def test_unchanged_state_reuses_slot_image(self, renderer):
+        """Test that an unchanged widget state is not re-rendered."""
+        from unittest.mock import patch
+
+        layout = self._entity_layout()
+        widget = layout.slots[0].widget
+        _, draw = renderer.create_canvas()
+
+        with patch.object(widget, "render", wraps=widget.render) as render:
+            layout.render(renderer, draw, self._states("21.5"))
+            layout.render(renderer, draw, self._states("21.5"))
+            assert render.call_count == 1
+
+            layout.render(renderer, draw, self._states("22.0"))
+            assert render.call_count == 2
+
+    def test_cached_render_matches_fresh_render(self, renderer):
+        """Test that a cached slot produces the same pixels as a fresh render."""
+        layout = self._entity_layout()
+
+        fresh_img, fresh_draw = renderer.create_canvas()
+        layout.render(renderer, fresh_draw, self._states("21.5"))
+
+        cached_img, cached_draw = renderer.create_canvas()
+        layout.render(renderer, cached_draw, self._states("21.5"))
+
+        assert fresh_img.tobytes() == cached_img.tobytes()
+
+    def test_clear_render_cache(self, renderer):
+        """Test that clearing the cache forces a re-render."""
+        from unittest.mock import patch
+
+        layout = self._entity_layout()
+        widget = layout.slots[0].widget
+        _, draw = renderer.create_canvas()
+
+        with patch.object(widget, "render", wraps=widget.render) as render:
+            layout.render(renderer, draw, self._states("21.5"))
+            layout.clear_render_cache()
+            layout.render(renderer, draw, self._states("21.5"))
+            assert render.call_count == 2
+
+    def test_cache_is_bounded(self, renderer):
+        """Test that the tile cache never grows past its size cap."""
+        from custom_components.geekmagic.layouts.base import TILE_CACHE_SIZE
+
+        layout = self._entity_layout()
+        _, draw = renderer.create_canvas()
+
+        for i in range(TILE_CACHE_SIZE + 5):
+            layout.render(renderer, draw, self._states(str(i)))
+
+        assert len(layout._tile_cache) == TILE_CACHE_SIZE
+
+    def test_render_frame_matches_full_render(self, renderer):
+        """Test that the persistent canvas matches a full render after changes."""
+        layout = self._entity_layout()
+
+        layout.render_frame(renderer, self._states("21.5"))
+        frame = layout.render_frame(renderer, self._states("22.0"))
+
+        full_img, full_draw = renderer.create_canvas(background=layout.theme.background)
+        layout.render(renderer, full_draw, self._states("22.0"))
+
+        assert frame.tobytes() == full_img.tobytes()
+
+    def test_render_frame_skips_unchanged_slots(self, renderer):
+        """Test that unchanged slots are not pasted onto the kept canvas again."""
+        from unittest.mock import patch
+
+        layout = self._entity_layout()
+        first = layout.render_frame(renderer, self._states("21.5"))
+
+        with patch.object(first, "paste", wraps=first.paste) as paste:
+            second = layout.render_frame(renderer, self._states("21.5"))
+            assert second is first
+            paste.assert_not_called()
+
+            layout.render_frame(renderer, self._states("22.0"))
+            paste.assert_called_once()
+
+    def test_render_frame_clears_removed_widget(self, renderer):
+        """Test that emptying a slot restores the background there."""
+        layout = self._entity_layout()
+        layout.render_frame(renderer, self._states("21.5"))
+
+        layout.slots[0].widget = None
+        frame = layout.render_frame(renderer, {})
+
+        empty_img, _ = renderer.create_canvas(background=layout.theme.background)
+        assert frame.tobytes() == empty_img.tobytes()
+
+    def test_render_frame_scanlines_not_reapplied(self, renderer):
+        """Test that in-place theme effects don't accumulate across frames."""
+        from custom_components.geekmagic.widgets.theme import THEME_RETRO
+
+        layout = self._entity_layout()
+        layout.theme = THEME_RETRO
+
+        first = layout.render_frame(renderer, self._states("21.5")).tobytes()
+        second = layout.render_frame(renderer, self._states("21.5")).tobytes()
+
+        assert first == second
+
+
+class TestLayoutScanlines:
+    """Tests for the retro scanline theme effect."""
+
+    def test_scanlines_match_per_pixel_darkening(self, renderer):
+        """Test that every third scaled row is darkened to int(value * 0.7)."""
+        from PIL import Image
+
+        width, height = 48, 30
+        data = bytes((i * 37) % 256 for i in range(width * height * 3))
+        canvas = Image.frombytes("RGB", (width, height), data)
+        original = canvas.copy()
+
+        Grid2x2()._apply_scanlines(canvas, scale=2)
+
+        for y in range(height):
+            for x in range(width):
+                r, g, b = original.getpixel((x, y))
+                darkened = (int(r * 0.7), int(g * 0.7), int(b * 0.7))
+                expected = darkened if y % 6 == 0 else (r, g, b)
+                assert canvas.getpixel((x, y)) == expected
@@ -1,13 +1,8 @@
 """Tests for GeekMagic config flow."""
 
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.geekmagic.config_flow import (
@@ -48,7 +43,6 @@ class TestConfigFlowImports:
 class TestConfigFlowUser:
     """Test user config flow step using hass fixture."""
 
-    @pytest.mark.asyncio
     async def test_user_flow_shows_form(self, hass):
         """Test that user flow shows the configuration form."""
         result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": "user"})
@@ -57,94 +51,17 @@ class TestConfigFlowUser:
         assert result["step_id"] == "user"
         assert "host" in result["data_schema"].schema
 
-    @pytest.mark.asyncio
-    async def test_user_flow_connection_failure(self, hass):
-        """Test user flow handles connection failure."""
-        with (
-            patch(
-                "custom_components.geekmagic.config_flow.async_get_clientsession"
-            ) as mock_get_session,
-            patch("custom_components.geekmagic.config_flow.GeekMagicDevice") as mock_device_class,
-        ):
-            mock_get_session.return_value = AsyncMock()
-            mock_device = mock_device_class.return_value
-            mock_device.host = "192.168.1.100"
-            mock_device.test_connection = AsyncMock(
-                return_value=ConnectionResult(success=False, error="unknown", message="Test error")
-            )
-
-            result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": "user"})
-            result = await hass.config_entries.flow.async_configure(
-                result["flow_id"],
-                user_input={"host": "192.168.1.100", "name": "Test Display"},
-            )
-
-            assert result["type"] == FlowResultType.FORM
-            assert result["errors"] == {"base": "unknown"}
-
-        await hass.async_block_till_done()
-
-    @pytest.mark.asyncio
-    async def test_user_flow_connection_timeout(self, hass):
-        """Test user flow shows timeout error."""
-        with (
-            patch(
-                "custom_components.geekmagic.config_flow.async_get_clientsession"
-            ) as mock_get_session,
-            patch("custom_components.geekmagic.config_flow.GeekMagicDevice") as mock_device_class,
-        ):
-            mock_get_session.return_value = AsyncMock()
-            mock_device = mock_device_class.return_value
-            mock_device.host = "192.168.1.100"
-            mock_device.test_connection = AsyncMock(
-                return_value=ConnectionResult(
-                    success=False, error="timeout", message="Connection timed out"
-                )
-            )
-
-            result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": "user"})
-            result = await hass.config_entries.flow.async_configure(
-                result["flow_id"],
-                user_input={"host": "192.168.1.100", "name": "Test Display"},
-            )
-
-            assert result["type"] == FlowResultType.FORM
-            assert result["errors"] == {"base": "timeout"}
-
-        await hass.async_block_till_done()
-
-    @pytest.mark.asyncio
-    async def test_user_flow_connection_dns_error(self, hass):
-        """Test user flow shows DNS error."""
-        with (
-            patch(
-                "custom_components.geekmagic.config_flow.async_get_clientsession"
-            ) as mock_get_session,
-            patch("custom_components.geekmagic.config_flow.GeekMagicDevice") as mock_device_class,
-        ):
-            mock_get_session.return_value = AsyncMock()
-            mock_device = mock_device_class.return_value
-            mock_device.host = "invalid.hostname"
-            mock_device.test_connection = AsyncMock(
-                return_value=ConnectionResult(
-                    success=False, error="dns_error", message="Could not resolve hostname"
-                )
-            )
-
-            result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": "user"})
-            result = await hass.config_entries.flow.async_configure(
-                result["flow_id"],
-                user_input={"host": "invalid.hostname", "name": "Test Display"},
-            )
-
-            assert result["type"] == FlowResultType.FORM
-            assert result["errors"] == {"base": "dns_error"}
-
-        await hass.async_block_till_done()
-
-    @pytest.mark.asyncio
-    async def test_user_flow_connection_refused(self, hass):
-        """Test user flow shows connection refused error."""
+    @pytest.mark.parametrize(
+        ("host", "error", "message"),
+        [
+            ("192.168.1.100", "unknown", "Test error"),
+            ("192.168.1.100", "timeout", "Connection timed out"),
+            ("invalid.hostname", "dns_error", "Could not resolve hostname"),
+            ("192.168.1.100", "connection_refused", "Connection refused"),
+        ],
+    )
+    async def test_user_flow_connection_error(self, hass, host, error, message):
+        """Test user flow shows the connection error reported by the device."""
         with (
             patch(
                 "custom_components.geekmagic.config_flow.async_get_clientsession"
@@ -153,25 +70,22 @@ class TestConfigFlowUser:
         ):
             mock_get_session.return_value = AsyncMock()
             mock_device = mock_device_class.return_value
-            mock_device.host = "192.168.1.100"
+            mock_device.host = host
             mock_device.test_connection = AsyncMock(
-                return_value=ConnectionResult(
-                    success=False, error="connection_refused", message="Connection refused"
-                )
+                return_value=ConnectionResult(success=False, error=error, message=message)
             )
 
             result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": "user"})
             result = await hass.config_entries.flow.async_configure(
                 result["flow_id"],
-                user_input={"host": "192.168.1.100", "name": "Test Display"},
+                user_input={"host": host, "name": "Test Display"},
             )
 
             assert result["type"] == FlowResultType.FORM
-            assert result["errors"] == {"base": "connection_refused"}
+            assert result["errors"] == {"base": error}
 
         await hass.async_block_till_done()
 
-    @pytest.mark.asyncio
     async def test_user_flow_success(self, hass):
         """Test successful user flow creates entry."""
         with (
@@ -207,7 +121,6 @@ class TestConfigFlowUser:
 
         await hass.async_block_till_done()
 
-    @pytest.mark.asyncio
     async def test_user_flow_success_with_url(self, hass):
         """Test successful user flow with URL input normalizes the host."""
         with (
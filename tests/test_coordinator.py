@@ -1,5 +1,7 @@
 """Tests for GeekMagic coordinator multi-screen support."""
 
+import math
+import time
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -77,6 +79,8 @@ class TestCoordinatorMigration:
         """Test that already-migrated options are unchanged."""
         coordinator = GeekMagicCoordinator(hass, coordinator_device, new_format_options)
 
+        # New-format options are used as-is, without a rebuilt copy
+        assert coordinator.options is new_format_options
         assert coordinator.options[CONF_SCREEN_CYCLE_INTERVAL] == 30
         assert len(coordinator.options[CONF_SCREENS]) == 2
 
@@ -99,7 +103,6 @@ class TestCoordinatorMultiScreen:
         coordinator = GeekMagicCoordinator(hass, coordinator_device, new_format_options)
         assert coordinator.current_screen_name == "Dashboard"
 
-    @pytest.mark.asyncio
     async def test_set_screen(self, hass, coordinator_device, new_format_options):
         """Test setting screen by index."""
         coordinator = GeekMagicCoordinator(hass, coordinator_device, new_format_options)
@@ -109,7 +112,6 @@ class TestCoordinatorMultiScreen:
         assert coordinator.current_screen == 1
         assert coordinator.current_screen_name == "Media"
 
-    @pytest.mark.asyncio
     async def test_set_screen_invalid_index(self, hass, coordinator_device, new_format_options):
         """Test setting invalid screen index is ignored."""
         coordinator = GeekMagicCoordinator(hass, coordinator_device, new_format_options)
@@ -118,7 +120,17 @@ class TestCoordinatorMultiScreen:
         await coordinator.async_set_screen(10)  # Invalid index
         assert coordinator.current_screen == 0  # Should remain unchanged
 
-    @pytest.mark.asyncio
+    async def test_set_screen_same_index_no_refresh(
+        self, hass, coordinator_device, new_format_options
+    ):
+        """Test selecting the current screen does not trigger a refresh."""
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, new_format_options)
+        coordinator.async_request_refresh = AsyncMock()  # type: ignore[method-assign]
+
+        await coordinator.async_set_screen(0)
+        assert coordinator.current_screen == 0
+        coordinator.async_request_refresh.assert_not_called()
+
     async def test_next_screen(self, hass, coordinator_device, new_format_options):
         """Test cycling to next screen."""
         coordinator = GeekMagicCoordinator(hass, coordinator_device, new_format_options)
@@ -130,7 +142,6 @@ class TestCoordinatorMultiScreen:
         await coordinator.async_next_screen()
         assert coordinator.current_screen == 0  # Wraps around
 
-    @pytest.mark.asyncio
     async def test_previous_screen(self, hass, coordinator_device, new_format_options):
         """Test cycling to previous screen."""
         coordinator = GeekMagicCoordinator(hass, coordinator_device, new_format_options)
@@ -141,6 +152,49 @@ class TestCoordinatorMultiScreen:
         assert coordinator.current_screen == 1  # Wraps around
 
 
+class TestCoordinatorAutoCycle:
+    """Test screen auto-cycling deadline."""
+
+    @pytest.fixture
+    def cycle_device(self):
+        """Create mock device for full update cycles."""
+        device = MagicMock()
+        device.host = "192.168.1.100"
+        device.model = "unknown"
+        device.upload_and_display = AsyncMock()
+        device.get_brightness = AsyncMock(return_value=50)
+        device.get_state = AsyncMock(return_value=None)
+        device.get_space = AsyncMock(return_value=None)
+        return device
+
+    def test_deadline_from_cycle_interval(self, hass, cycle_device, new_format_options):
+        """Test the cycle deadline is one interval away on a monotonic clock."""
+        before = time.monotonic()
+        coordinator = GeekMagicCoordinator(hass, cycle_device, new_format_options)
+
+        assert before + 30 <= coordinator._next_cycle_at <= time.monotonic() + 30
+
+    def test_cycling_disabled_never_due(self, hass, cycle_device, new_format_options):
+        """Test a zero cycle interval disables the deadline."""
+        coordinator = GeekMagicCoordinator(hass, cycle_device, new_format_options)
+        coordinator.update_options({**new_format_options, CONF_SCREEN_CYCLE_INTERVAL: 0})
+
+        assert coordinator._next_cycle_at == math.inf
+
+    async def test_advances_when_deadline_passed(self, hass, cycle_device, new_format_options):
+        """Test a refresh past the deadline advances the screen and re-arms it."""
+        coordinator = GeekMagicCoordinator(hass, cycle_device, new_format_options)
+
+        await coordinator._async_update_data()
+        assert coordinator.current_screen == 0
+
+        coordinator._next_cycle_at = time.monotonic() - 1
+        await coordinator._async_update_data()
+
+        assert coordinator.current_screen == 1
+        assert coordinator._next_cycle_at > time.monotonic() + 29
+
+
 class TestCoordinatorUpdateOptions:
     """Test options update functionality."""
 
@@ -163,15 +217,60 @@ class TestCoordinatorUpdateOptions:
 
         assert coordinator.screen_count == 3
 
+    def test_update_options_reuses_unchanged_widgets(
+        self, hass, coordinator_device, new_format_options
+    ):
+        """Test that widgets with unchanged config are reused across rebuilds."""
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, new_format_options)
+        clock = coordinator._layouts[0].slots[0].widget
+
+        new_options = {
+            **new_format_options,
+            CONF_SCREENS: [
+                {**new_format_options[CONF_SCREENS][0]},
+                {
+                    "name": "Media",
+                    CONF_LAYOUT: LAYOUT_SPLIT_H,
+                    CONF_WIDGETS: [{"type": "text", "slot": 0, "options": {"text": "Hi"}}],
+                },
+            ],
+        }
+        coordinator.update_options(new_options)
+
+        assert coordinator._layouts[0].slots[0].widget is clock
+        assert coordinator._layouts[1].slots[0].widget.config.widget_type == "text"
+        assert len(coordinator._widgets) == 2
+
+    def test_update_options_reuses_unchanged_layouts(
+        self, hass, coordinator_device, new_format_options
+    ):
+        """Test that only screens whose config changed get a new layout."""
+        screens = [
+            {**new_format_options[CONF_SCREENS][0]},
+            {
+                "name": "Media",
+                CONF_LAYOUT: LAYOUT_SPLIT_H,
+                CONF_WIDGETS: [{"type": "text", "slot": 0, "options": {"text": "Hi"}}],
+            },
+        ]
+        options = {**new_format_options, CONF_SCREENS: screens}
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, options)
+        first, second = coordinator._layouts
+
+        changed = {**screens[1], CONF_WIDGETS: [{"type": "text", "slot": 0}]}
+        coordinator.update_options({**options, CONF_SCREENS: [screens[0], changed]})
+
+        assert coordinator._layouts[0] is first
+        assert coordinator._layouts[1] is not second
+        assert len(coordinator._screen_layouts) == 2
+
 
 class TestCoordinatorWidgetRegistration:
     """Test that all widget types are registered."""
 
-    def test_all_widgets_registered(self):
-        """Test that all widget types are registered."""
-        from custom_components.geekmagic.coordinator import WIDGET_CLASSES
-
-        expected_widgets = [
+    @pytest.mark.parametrize(
+        "widget_type",
+        [
             "attribute_list",
             "camera",
             "climate",
@@ -186,10 +285,18 @@ class TestCoordinatorWidgetRegistration:
             "status",
             "status_list",
             "weather",
-        ]
+            "icon",
+        ],
+    )
+    def test_widget_registered(self, widget_type):
+        """Test that each widget type is registered."""
+        from custom_components.geekmagic.coordinator import WIDGET_CLASSES
 
-        for widget_type in expected_widgets:
-            assert widget_type in WIDGET_CLASSES, f"Widget {widget_type} not registered"
+        assert widget_type in WIDGET_CLASSES, f"Widget {widget_type} not registered"
+
+    def test_widget_count(self):
+        """Test that no unexpected widget types are registered."""
+        from custom_components.geekmagic.coordinator import WIDGET_CLASSES
 
         assert len(WIDGET_CLASSES) == 15
 
@@ -661,7 +768,6 @@ class TestCoordinatorBackoff:
         assert coordinator._base_update_interval == 30
         assert coordinator.update_interval == timedelta(seconds=30)
 
-    @pytest.mark.asyncio
     async def test_device_offline_skips_rendering(self, hass, backoff_device, simple_options):
         """Test that offline device skips expensive rendering.
 
@@ -695,7 +801,6 @@ class TestCoordinatorBackoff:
         # Verify connectivity check WAS called
         backoff_device.test_connection.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_device_comes_back_online(self, hass, backoff_device, simple_options):
         """Test that device recovery resets backoff and resumes updates."""
         coordinator = GeekMagicCoordinator(hass, backoff_device, simple_options)
@@ -711,7 +816,7 @@ class TestCoordinatorBackoff:
         )
 
         # Mock the rendering to succeed
-        with patch.object(coordinator, "_render_display", return_value=(b"jpeg", b"png")):
+        with patch.object(coordinator, "_render_display", return_value=b"jpeg"):
             result = await coordinator._async_update_data()
 
         # Verify backoff was reset
@@ -722,7 +827,6 @@ class TestCoordinatorBackoff:
         # Verify update succeeded
         assert result["success"] is True
 
-    @pytest.mark.asyncio
     async def test_first_failure_marks_offline(self, hass, backoff_device, simple_options):
         """Test that first update failure marks device offline and applies backoff."""
         from homeassistant.helpers.update_coordinator import UpdateFailed
@@ -734,7 +838,7 @@ class TestCoordinatorBackoff:
 
         # Mock the rendering to succeed but upload fails
         with (
-            patch.object(coordinator, "_render_display", return_value=(b"jpeg", b"png")),
+            patch.object(coordinator, "_render_display", return_value=b"jpeg"),
             pytest.raises(UpdateFailed),
         ):
             await coordinator._async_update_data()
@@ -747,7 +851,6 @@ class TestCoordinatorBackoff:
         # Verify backoff was applied
         assert coordinator.update_interval == timedelta(seconds=20)  # 10 * 2^1
 
-    @pytest.mark.asyncio
     async def test_test_connection_exception_handled(self, hass, backoff_device, simple_options):
         """Test that exceptions from test_connection() are handled gracefully.
 
@@ -777,3 +880,77 @@ class TestCoordinatorBackoff:
 
         # Verify expensive operations were NOT called
         backoff_device.upload_and_display.assert_not_called()
+
+
+class TestCoordinatorPreviewImage:
+    """Tests for the preview image reusing the device JPEG."""
+
+    @pytest.fixture
+    def preview_device(self):
+        """Create mock device for full update cycles."""
+        device = MagicMock()
+        device.host = "192.168.1.100"
+        device.model = "unknown"
+        device.upload_and_display = AsyncMock()
+        device.get_brightness = AsyncMock(return_value=50)
+        device.get_state = AsyncMock(return_value=None)
+        device.get_space = AsyncMock(return_value=None)
+        return device
+
+    async def test_preview_is_uploaded_jpeg(self, hass, preview_device, new_format_options):
+        """Test that the preview is the uploaded JPEG and no PNG is encoded."""
+        coordinator = GeekMagicCoordinator(hass, preview_device, new_format_options)
+
+        with patch.object(coordinator.renderer, "to_png") as to_png:
+            await coordinator._async_update_data()
+
+        to_png.assert_not_called()
+        uploaded = preview_device.upload_and_display.call_args.args[0]
+        assert coordinator.last_image is uploaded
+        assert coordinator.last_image[:3] == b"\xff\xd8\xff"
+        assert coordinator.preview_just_updated is True
+
+    async def test_periodic_refresh_keeps_preview(self, hass, preview_device, new_format_options):
+        """Test that periodic refreshes don't replace the preview image."""
+        coordinator = GeekMagicCoordinator(hass, preview_device, new_format_options)
+        await coordinator._async_update_data()
+        image = coordinator.last_image
+
+        await coordinator._async_update_data()
+
+        assert coordinator.last_image is image
+        assert coordinator.preview_just_updated is False
+
+
+class TestBuildWidgetStates:
+    """Tests for per-tick entity state snapshots."""
+
+    async def test_shared_entity_read_once(self, hass, coordinator_device):
+        """Test that an entity used by several widgets is read from HA once."""
+        hass.states.async_set("sensor.temp", "21.5", {"unit_of_measurement": "°C"})
+        options = {
+            CONF_SCREENS: [
+                {
+                    "name": "Shared",
+                    CONF_LAYOUT: LAYOUT_GRID_2X2,
+                    CONF_WIDGETS: [
+                        {"type": "entity", "slot": 0, "entity_id": "sensor.temp"},
+                        {"type": "gauge", "slot": 1, "entity_id": "sensor.temp"},
+                        {"type": "entity", "slot": 2, "entity_id": "sensor.missing"},
+                    ],
+                }
+            ],
+        }
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, options)
+        layout = coordinator._layouts[0]
+
+        state_machine = type(hass.states)
+        with patch.object(
+            state_machine, "get", autospec=True, side_effect=state_machine.get
+        ) as get_state:
+            states = coordinator._build_widget_states(layout)
+
+        assert [c.args[1] for c in get_state.call_args_list].count("sensor.temp") == 1
+        assert states[0].entity is states[1].entity
+        assert states[0].entity.state == "21.5"
+        assert states[2].entity is None
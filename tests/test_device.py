@@ -1,10 +1,5 @@
 """Tests for GeekMagic device client."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
@@ -104,7 +99,6 @@ class TestGeekMagicDevice:
         assert device._session == mock_session
         assert device._owns_session is False
 
-    @pytest.mark.asyncio
     async def test_get_state(self, mock_session, mock_response):
         """Test getting device state."""
         mock_response.json = AsyncMock(
@@ -119,7 +113,6 @@ class TestGeekMagicDevice:
         assert state.current_image == "/image/dashboard.jpg"
         mock_session.get.assert_called_once_with("http://192.168.1.100/app.json")
 
-    @pytest.mark.asyncio
     async def test_get_space(self, mock_session, mock_response):
         """Test getting storage info."""
         mock_response.json = AsyncMock(return_value={"total": 1048576, "free": 524288})
@@ -130,7 +123,6 @@ class TestGeekMagicDevice:
         assert space.total == 1048576
         assert space.free == 524288
 
-    @pytest.mark.asyncio
     async def test_get_brightness(self, mock_session, mock_response):
         """Test getting brightness."""
         # API returns brightness as string
@@ -142,7 +134,6 @@ class TestGeekMagicDevice:
         assert brightness == 71
         mock_session.get.assert_called_once_with("http://192.168.1.100/brt.json")
 
-    @pytest.mark.asyncio
     async def test_set_brightness(self, mock_session, mock_response):
         """Test setting brightness."""
         device = GeekMagicDevice("192.168.1.100", session=mock_session)
@@ -150,7 +141,6 @@ class TestGeekMagicDevice:
 
         mock_session.get.assert_called_with("http://192.168.1.100/set?brt=80")
 
-    @pytest.mark.asyncio
     async def test_set_brightness_clamps_values(self, mock_session, mock_response):
         """Test brightness values are clamped to 0-100."""
         device = GeekMagicDevice("192.168.1.100", session=mock_session)
@@ -161,7 +151,6 @@ class TestGeekMagicDevice:
         await device.set_brightness(-10)
         mock_session.get.assert_called_with("http://192.168.1.100/set?brt=0")
 
-    @pytest.mark.asyncio
     async def test_set_theme(self, mock_session, mock_response):
         """Test setting theme."""
         device = GeekMagicDevice("192.168.1.100", session=mock_session)
@@ -169,7 +158,6 @@ class TestGeekMagicDevice:
 
         mock_session.get.assert_called_with("http://192.168.1.100/set?theme=3")
 
-    @pytest.mark.asyncio
     async def test_set_image(self, mock_session, mock_response):
         """Test setting displayed image."""
         device = GeekMagicDevice("192.168.1.100", session=mock_session)
@@ -181,7 +169,6 @@ class TestGeekMagicDevice:
         assert "theme=3" in str(calls[0])
         assert "img=/image/dashboard.jpg" in str(calls[1])
 
-    @pytest.mark.asyncio
     async def test_upload(self, mock_session, mock_response):
         """Test uploading an image."""
         device = GeekMagicDevice("192.168.1.100", session=mock_session)
@@ -193,7 +180,6 @@ class TestGeekMagicDevice:
         call_args = mock_session.post.call_args
         assert "doUpload" in call_args[0][0]
 
-    @pytest.mark.asyncio
     async def test_upload_png(self, mock_session, mock_response):
         """Test uploading a PNG image."""
         device = GeekMagicDevice("192.168.1.100", session=mock_session)
@@ -203,7 +189,6 @@ class TestGeekMagicDevice:
 
         mock_session.post.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_upload_ignores_duplicate_content_length_error(self, mock_session):
         """Test upload ignores malformed HTTP with duplicate Content-Length."""
         import aiohttp
@@ -223,7 +208,6 @@ class TestGeekMagicDevice:
         # Should not raise - error is ignored
         await device.upload(image_data, "test.jpg")
 
-    @pytest.mark.asyncio
     async def test_upload_ignores_data_after_close_error(self, mock_session):
         """Test upload ignores malformed HTTP with data after Connection: close."""
         import aiohttp
@@ -243,7 +227,6 @@ class TestGeekMagicDevice:
         # Should not raise - error is ignored
         await device.upload(image_data, "test.jpg")
 
-    @pytest.mark.asyncio
     async def test_upload_and_display(self, mock_session, mock_response):
         """Test uploading and displaying an image."""
         device = GeekMagicDevice("192.168.1.100", session=mock_session)
@@ -255,7 +238,6 @@ class TestGeekMagicDevice:
         assert mock_session.post.called
         assert mock_session.get.called
 
-    @pytest.mark.asyncio
     async def test_delete_file(self, mock_session, mock_response):
         """Test deleting a file."""
         device = GeekMagicDevice("192.168.1.100", session=mock_session)
@@ -263,7 +245,6 @@ class TestGeekMagicDevice:
 
         mock_session.get.assert_called_with("http://192.168.1.100/delete?file=/image/old.jpg")
 
-    @pytest.mark.asyncio
     async def test_clear_images(self, mock_session, mock_response):
         """Test clearing all images."""
         device = GeekMagicDevice("192.168.1.100", session=mock_session)
@@ -271,7 +252,6 @@ class TestGeekMagicDevice:
 
         mock_session.get.assert_called_with("http://192.168.1.100/set?clear=image")
 
-    @pytest.mark.asyncio
     async def test_test_connection_success(self, mock_session, mock_response):
         """Test connection test succeeds."""
         # Connection test uses /space.json endpoint (wider firmware support)
@@ -286,7 +266,6 @@ class TestGeekMagicDevice:
         assert result
         mock_session.get.assert_called_once_with("http://192.168.1.100/space.json")
 
-    @pytest.mark.asyncio
     async def test_test_connection_failure(self, mock_session, mock_response):
         """Test connection test fails gracefully with generic error."""
         mock_session.get.side_effect = aiohttp.ClientError("Connection refused")
@@ -300,7 +279,6 @@ class TestGeekMagicDevice:
         # ConnectionResult should be falsy when failed
         assert not result
 
-    @pytest.mark.asyncio
     async def test_test_connection_timeout(self, mock_session, mock_response):
         """Test connection test returns timeout error."""
         mock_session.get.side_effect = TimeoutError()
@@ -313,7 +291,6 @@ class TestGeekMagicDevice:
         assert result.message is not None
         assert "timed out" in result.message.lower()
 
-    @pytest.mark.asyncio
     async def test_test_connection_dns_error(self, mock_session, mock_response):
         """Test connection test returns DNS error."""
         # Create a DNS error with proper arguments
@@ -329,7 +306,6 @@ class TestGeekMagicDevice:
         assert result.message is not None
         assert "resolve" in result.message.lower()
 
-    @pytest.mark.asyncio
     async def test_test_connection_refused(self, mock_session, mock_response):
         """Test connection test returns connection refused error."""
         mock_session.get.side_effect = aiohttp.ClientConnectorError(
@@ -342,7 +318,6 @@ class TestGeekMagicDevice:
         assert result.success is False
         assert result.error == "connection_refused"
 
-    @pytest.mark.asyncio
     async def test_test_connection_http_error(self, mock_session, mock_response):
         """Test connection test returns HTTP error."""
         mock_session.get.side_effect = aiohttp.ClientResponseError(
@@ -357,7 +332,6 @@ class TestGeekMagicDevice:
         assert result.message is not None
         assert "500" in result.message
 
-    @pytest.mark.asyncio
     async def test_close_owned_session(self):
         """Test closing owned session."""
         with patch("aiohttp.ClientSession") as mock_cls:
@@ -371,7 +345,6 @@ class TestGeekMagicDevice:
 
             mock_session.close.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_close_external_session(self, mock_session):
         """Test not closing external session."""
         device = GeekMagicDevice("192.168.1.100", session=mock_session)
@@ -404,7 +377,6 @@ class TestDeviceModelDetection:
         device = GeekMagicDevice("192.168.1.100")
         assert device.model == MODEL_UNKNOWN
 
-    @pytest.mark.asyncio
     async def test_detect_model_pro(self, mock_session):
         """Test detecting Pro model via /.sys/app.json."""
         from custom_components.geekmagic.const import MODEL_PRO
@@ -426,7 +398,6 @@ class TestDeviceModelDetection:
         call_url = mock_session.get.call_args[0][0]
         assert "/.sys/app.json" in call_url
 
-    @pytest.mark.asyncio
     async def test_detect_model_ultra(self, mock_session):
         """Test detecting Ultra model when Pro path fails."""
         from custom_components.geekmagic.const import MODEL_ULTRA
@@ -450,7 +421,6 @@ class TestDeviceModelDetection:
         assert result == MODEL_ULTRA
         assert device.model == MODEL_ULTRA
 
-    @pytest.mark.asyncio
     async def test_navigate_next(self, mock_session):
         """Test Pro navigate next."""
         mock_response = MagicMock()
@@ -464,7 +434,6 @@ class TestDeviceModelDetection:
 
         mock_session.get.assert_called_with("http://192.168.1.100/set?page=1")
 
-    @pytest.mark.asyncio
     async def test_navigate_previous(self, mock_session):
         """Test Pro navigate previous."""
         mock_response = MagicMock()
@@ -478,7 +447,6 @@ class TestDeviceModelDetection:
 
         mock_session.get.assert_called_with("http://192.168.1.100/set?page=-1")
 
-    @pytest.mark.asyncio
     async def test_navigate_enter(self, mock_session):
         """Test Pro navigate enter."""
         mock_response = MagicMock()
@@ -492,7 +460,6 @@ class TestDeviceModelDetection:
 
         mock_session.get.assert_called_with("http://192.168.1.100/set?enter=-1")
 
-    @pytest.mark.asyncio
     async def test_reboot(self, mock_session):
         """Test Pro reboot."""
         mock_response = MagicMock()
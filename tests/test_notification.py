@@ -1,5 +1,6 @@
 """Tests for GeekMagic notification service."""
 
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -43,10 +44,18 @@ def options():
     }
 
 
+def _stub_rendering(coordinator: GeekMagicCoordinator) -> None:
+    """Replace PIL output and widget state building with cheap stubs."""
+    canvas = (MagicMock(), MagicMock())
+    coordinator.renderer.create_canvas = lambda *_args, **_kwargs: canvas
+    coordinator.renderer.to_jpeg = lambda *_args, **_kwargs: b"jpeg"
+    coordinator.renderer.to_png = lambda *_args, **_kwargs: b"png"
+    coordinator._build_widget_states = lambda *_args, **_kwargs: {}
+
+
 class TestNotification:
     """Test notification functionality."""
 
-    @pytest.mark.asyncio
     async def test_trigger_notification(self, hass, coordinator_device, options):
         """Test triggering a notification sets state."""
         coordinator = GeekMagicCoordinator(hass, coordinator_device, options)
@@ -54,19 +63,16 @@ class TestNotification:
 
         data = {"message": "Hello World", "title": "Alert", "duration": 5, "icon": "mdi:test"}
 
-        with (
-            patch("time.time", return_value=1000),
-            patch.object(hass.loop, "call_later") as mock_call_later,
-        ):
+        before = time.time()
+        with patch.object(hass.loop, "call_later") as mock_call_later:
             await coordinator.trigger_notification(data)
 
             assert coordinator._notification_data == data
-            assert coordinator._notification_expiry == 1005
+            assert before + 5 <= coordinator._notification_expiry <= time.time() + 5
             assert coordinator.async_request_refresh.called
             mock_call_later.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_notification_layout_creation(self, hass, coordinator_device, options):
+    def test_notification_layout_creation(self, hass, coordinator_device, options):
         """Test notification layout is created correctly (HeroSimpleLayout)."""
         coordinator = GeekMagicCoordinator(hass, coordinator_device, options)
 
@@ -89,8 +95,7 @@ class TestNotification:
         assert text_widget.config.options["text"] == "Test Message"
         assert text_widget.config.options["align"] == "center"
 
-    @pytest.mark.asyncio
-    async def test_notification_layout_image_only(self, hass, coordinator_device, options):
+    def test_notification_layout_image_only(self, hass, coordinator_device, options):
         """Test notification layout with no message (FullscreenLayout)."""
         coordinator = GeekMagicCoordinator(hass, coordinator_device, options)
 
@@ -107,8 +112,7 @@ class TestNotification:
         assert camera_widget.config.widget_type == "camera"
         assert camera_widget.config.options["fit"] == "contain"
 
-    @pytest.mark.asyncio
-    async def test_notification_layout_image_entity(self, hass, coordinator_device, options):
+    def test_notification_layout_image_entity(self, hass, coordinator_device, options):
         """Test notification layout with an image entity."""
         coordinator = GeekMagicCoordinator(hass, coordinator_device, options)
 
@@ -122,8 +126,7 @@ class TestNotification:
         assert image_widget.config.widget_type == "camera"
         assert image_widget.config.entity_id == "image.reolink_snap"
 
-    @pytest.mark.asyncio
-    async def test_notification_layout_icon_only(self, hass, coordinator_device, options):
+    def test_notification_layout_icon_only(self, hass, coordinator_device, options):
         """Test notification with no message and no image (Fullscreen Icon)."""
         coordinator = GeekMagicCoordinator(hass, coordinator_device, options)
 
@@ -140,56 +143,34 @@ class TestNotification:
         assert icon_widget.config.options["icon"] == "mdi:alert"
         assert icon_widget.config.options["size"] == "huge"
 
-    @pytest.mark.asyncio
-    async def test_render_notification_active(self, hass, coordinator_device, options):
+    def test_render_notification_active(self, hass, coordinator_device, options):
         """Test render loop uses notification layout when active."""
         coordinator = GeekMagicCoordinator(hass, coordinator_device, options)
 
         # Setup active notification
         coordinator._notification_data = {"message": "Active"}
-        coordinator._notification_expiry = 2000
-
-        # Mock renderer methods to avoid actual PIL calls
-        coordinator.renderer.create_canvas = MagicMock(return_value=(MagicMock(), MagicMock()))
-        coordinator.renderer.to_jpeg = MagicMock(return_value=b"jpeg")
-        coordinator.renderer.to_png = MagicMock(return_value=b"png")
-
-        # Build widget states mock
-        coordinator._build_widget_states = MagicMock(return_value={})
-
-        with (
-            patch("time.time", return_value=1000),
-            patch.object(
-                coordinator,
-                "_create_notification_layout",
-                wraps=coordinator._create_notification_layout,
-            ) as mock_create,
-        ):
+        coordinator._notification_expiry = time.time() + 1000
+
+        _stub_rendering(coordinator)
+
+        with patch.object(
+            coordinator,
+            "_create_notification_layout",
+            wraps=coordinator._create_notification_layout,
+        ) as mock_create:
             coordinator._render_display()
             mock_create.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_render_notification_expired(self, hass, coordinator_device, options):
+    def test_render_notification_expired(self, hass, coordinator_device, options):
         """Test render loop ignores notification when expired."""
         coordinator = GeekMagicCoordinator(hass, coordinator_device, options)
 
         # Setup expired notification
         coordinator._notification_data = {"message": "Expired"}
-        coordinator._notification_expiry = 900
-
-        # Mock renderer methods
-        coordinator.renderer.create_canvas = MagicMock(return_value=(MagicMock(), MagicMock()))
-        coordinator.renderer.to_jpeg = MagicMock(return_value=b"jpeg")
-        coordinator.renderer.to_png = MagicMock(return_value=b"png")
-        coordinator._build_widget_states = MagicMock(return_value={})
-
-        with (
-            patch("time.time", return_value=1000),
-            patch.object(
-                coordinator,
-                "_create_notification_layout",
-                wraps=coordinator._create_notification_layout,
-            ) as mock_create,
-        ):
+        coordinator._notification_expiry = time.time() - 100
+
+        _stub_rendering(coordinator)
+
+        with patch.object(coordinator, "_create_notification_layout") as mock_create:
             coordinator._render_display()
             mock_create.assert_not_called()
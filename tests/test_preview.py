@@ -1,5 +1,7 @@
 """Tests for GeekMagic preview rendering."""
 
+import pytest
+
 from custom_components.geekmagic.const import (
     CONF_LAYOUT,
     CONF_WIDGETS,
@@ -15,6 +17,8 @@ from custom_components.geekmagic.preview import (
     render_screen_preview,
 )
 
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
 
 class TestMockState:
     """Test MockState class."""
@@ -35,6 +39,11 @@ class TestMockState:
         state = MockState(entity_id="sensor.test", state="on")
         assert state.attributes == {}
 
+    def test_no_instance_dict(self):
+        """Test mock states are slotted."""
+        state = MockState(entity_id="sensor.test", state="on")
+        assert not hasattr(state, "__dict__")
+
 
 class TestMockStates:
     """Test MockStates registry."""
@@ -73,39 +82,28 @@ class TestMockHass:
 class TestRenderPreview:
     """Test preview rendering."""
 
-    def test_render_clock_widget(self):
-        """Test rendering a clock widget."""
-        widgets_config = [{"type": "clock", "slot": 0}]
-        result = render_preview(LAYOUT_GRID_2X2, widgets_config)
-
-        assert isinstance(result, bytes)
-        assert len(result) > 0
-        # PNG magic bytes
-        assert result[:8] == b"\x89PNG\r\n\x1a\n"
-
-    def test_render_entity_widget(self):
-        """Test rendering an entity widget."""
-        widgets_config = [
-            {"type": "entity", "slot": 0, "entity_id": "sensor.temp", "label": "Temp"}
-        ]
-        result = render_preview(LAYOUT_GRID_2X2, widgets_config)
-
-        assert isinstance(result, bytes)
-        assert result[:8] == b"\x89PNG\r\n\x1a\n"
-
-    def test_render_gauge_widget(self):
-        """Test rendering a gauge widget."""
-        widgets_config = [
+    @pytest.mark.parametrize(
+        "widget_config",
+        [
+            {"type": "clock", "slot": 0},
+            {"type": "entity", "slot": 0, "entity_id": "sensor.temp", "label": "Temp"},
             {
                 "type": "gauge",
                 "slot": 0,
                 "entity_id": "sensor.cpu",
                 "options": {"style": "bar", "min": 0, "max": 100},
-            }
-        ]
-        result = render_preview(LAYOUT_GRID_2X2, widgets_config)
+            },
+            {"type": "weather", "slot": 0, "entity_id": "weather.home"},
+            {"type": "status", "slot": 0, "entity_id": "binary_sensor.motion"},
+        ],
+        ids=lambda config: config["type"],
+    )
+    def test_render_single_widget(self, widget_config):
+        """Test rendering a single widget of each type."""
+        result = render_preview(LAYOUT_GRID_2X2, [widget_config])
 
         assert isinstance(result, bytes)
+        assert result.startswith(PNG_MAGIC)
 
     def test_render_widgets_with_dynamic_bounds(self):
         """Test preview rendering with dynamic entity-bound limits/targets."""
@@ -151,7 +149,7 @@ class TestRenderPreview:
         ]
         result = render_preview(LAYOUT_GRID_2X2, widgets_config)
         assert isinstance(result, bytes)
-        assert result[:8] == b"\x89PNG\r\n\x1a\n"
+        assert result.startswith(PNG_MAGIC)
 
     def test_render_gauge_with_template_bounds(self):
         """Test preview rendering with gauge template-driven bounds."""
@@ -171,7 +169,7 @@ class TestRenderPreview:
         ]
         result = render_preview(LAYOUT_GRID_2X2, widgets_config)
         assert isinstance(result, bytes)
-        assert result[:8] == b"\x89PNG\r\n\x1a\n"
+        assert result.startswith(PNG_MAGIC)
 
     def test_render_widgets_with_template_options_hass_none(self):
         """Test preview renders with template options present when hass is None."""
@@ -232,7 +230,7 @@ class TestRenderPreview:
         ]
         result = render_preview(LAYOUT_GRID_3X2, widgets_config)
         assert isinstance(result, bytes)
-        assert result[:8] == b"\x89PNG\r\n\x1a\n"
+        assert result.startswith(PNG_MAGIC)
 
     def test_render_widgets_with_template_options_hass(self, hass):
         """Test preview renders with template options using real hass template evaluation."""
@@ -298,21 +296,7 @@ class TestRenderPreview:
         ]
         result = render_preview(LAYOUT_GRID_3X2, widgets_config, hass=hass)
         assert isinstance(result, bytes)
-        assert result[:8] == b"\x89PNG\r\n\x1a\n"
-
-    def test_render_weather_widget(self):
-        """Test rendering a weather widget."""
-        widgets_config = [{"type": "weather", "slot": 0, "entity_id": "weather.home"}]
-        result = render_preview(LAYOUT_GRID_2X2, widgets_config)
-
-        assert isinstance(result, bytes)
-
-    def test_render_status_widget(self):
-        """Test rendering a status widget."""
-        widgets_config = [{"type": "status", "slot": 0, "entity_id": "binary_sensor.motion"}]
-        result = render_preview(LAYOUT_GRID_2X2, widgets_config)
-
-        assert isinstance(result, bytes)
+        assert result.startswith(PNG_MAGIC)
 
     def test_render_multiple_widgets(self):
         """Test rendering multiple widgets."""
@@ -326,17 +310,11 @@ class TestRenderPreview:
 
         assert isinstance(result, bytes)
 
-    def test_render_different_layouts(self):
+    @pytest.mark.parametrize("layout", [LAYOUT_GRID_2X2, LAYOUT_SPLIT_H])
+    def test_render_different_layouts(self, layout):
         """Test rendering with different layouts."""
-        widgets_config = [{"type": "clock", "slot": 0}]
-
-        # Test Grid 2x2
-        result_grid = render_preview(LAYOUT_GRID_2X2, widgets_config)
-        assert isinstance(result_grid, bytes)
-
-        # Test Split
-        result_split = render_preview(LAYOUT_SPLIT_H, widgets_config)
-        assert isinstance(result_split, bytes)
+        result = render_preview(layout, [{"type": "clock", "slot": 0}])
+        assert isinstance(result, bytes)
 
     def test_render_empty_widgets(self):
         """Test rendering with no widgets."""
@@ -359,7 +337,7 @@ class TestRenderScreenPreview:
         result = render_screen_preview(screen_config)
 
         assert isinstance(result, bytes)
-        assert result[:8] == b"\x89PNG\r\n\x1a\n"
+        assert result.startswith(PNG_MAGIC)
 
     def test_render_screen_preview_default_layout(self):
         """Test rendering with default layout."""
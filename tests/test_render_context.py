@@ -1,10 +1,5 @@
 """Tests for RenderContext providing widget-local coordinate system."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from custom_components.geekmagic.const import (
     COLOR_BLACK,
     COLOR_CYAN,
@@ -30,6 +25,15 @@ class TestRenderContextInit:
         assert ctx.width == 100
         assert ctx.height == 100
 
+    def test_context_has_no_instance_dict(self):
+        """Test that RenderContext uses slots instead of a per-instance dict."""
+        renderer = Renderer()
+        _img, draw = renderer.create_canvas()
+
+        ctx = RenderContext(draw, (0, 0, 50, 50), renderer)
+
+        assert not hasattr(ctx, "__dict__")
+
     def test_init_stores_origin(self):
         """Test that origin position is stored correctly."""
         renderer = Renderer()
@@ -1,11 +1,7 @@
 """Tests for Pillow-based renderer with supersampling."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from PIL import Image, ImageDraw
+import pytest
+from PIL import Image, ImageDraw, ImageFont, features
 
 from custom_components.geekmagic.const import (
     COLOR_BLACK,
@@ -268,6 +264,50 @@ class TestRenderer:
         assert large_size[0] > small_size[0]
         assert large_size[1] > small_size[1]
 
+    def test_fonts_shared_between_renderers(self):
+        """Test that font objects are loaded once and shared across renderers."""
+        first = Renderer()
+        second = Renderer()
+
+        assert first.font_regular is second.font_regular
+        assert first.fit_text_font("12:34", 200, 100) is second.fit_text_font("12:34", 200, 100)
+
+    @pytest.mark.skipif(not features.check("raqm"), reason="libraqm not available")
+    def test_ascii_text_uses_basic_layout(self):
+        """Test that ASCII text is laid out without raqm shaping."""
+        from custom_components.geekmagic.renderer import _basic_layout_font
+
+        renderer = Renderer()
+        font = renderer.font_regular.font_variant(layout_engine=ImageFont.Layout.RAQM)
+
+        basic = _basic_layout_font(font)
+
+        assert basic.layout_engine == ImageFont.Layout.BASIC
+        assert basic.size == font.size
+
+    def test_basic_layout_font_keeps_basic_fonts(self):
+        """Test that fonts already on basic layout are used as-is."""
+        from custom_components.geekmagic.renderer import _basic_layout_font
+
+        renderer = Renderer()
+        font = renderer.font_regular.font_variant(layout_engine=ImageFont.Layout.BASIC)
+
+        assert _basic_layout_font(font) is font
+
+    def test_text_measurements_are_cached(self):
+        """Test that measuring the same text twice reuses the cached bbox."""
+        from custom_components.geekmagic.renderer import _text_bbox
+
+        renderer = Renderer()
+        text = "cache-probe 42%"
+        renderer.get_text_size(text, renderer.font_small)
+        hits = _text_bbox.cache_info().hits
+
+        assert renderer.get_text_size(text, renderer.font_small) == renderer.get_text_size(
+            text, renderer.font_small
+        )
+        assert _text_bbox.cache_info().hits == hits + 2
+
     def test_to_jpeg(self):
         """Test converting to JPEG."""
         renderer = Renderer()
@@ -343,6 +383,31 @@ class TestRenderer:
         jpeg = renderer.to_jpeg(img)
         assert len(jpeg) < MAX_IMAGE_SIZE
 
+    def test_to_jpeg_baseline_420(self):
+        """Test JPEG output is baseline 4:2:0 (libjpeg-turbo fast path)."""
+        from io import BytesIO
+
+        from PIL import JpegImagePlugin
+
+        renderer = Renderer()
+        img, _ = renderer.create_canvas()
+
+        decoded = Image.open(BytesIO(renderer.to_jpeg(img)))
+        assert JpegImagePlugin.get_sampling(decoded) == 2
+        assert "progressive" not in decoded.info
+
+    def test_to_jpeg_falls_back_to_pillow_without_turbojpeg(self):
+        """Test JPEG encoding works through Pillow when PyTurboJPEG is unavailable."""
+        from unittest.mock import patch
+
+        renderer = Renderer()
+        img, _ = renderer.create_canvas()
+
+        with patch("custom_components.geekmagic.renderer._get_turbojpeg", return_value=None):
+            jpeg_bytes = renderer.to_jpeg(img)
+
+        assert jpeg_bytes[:3] == b"\xff\xd8\xff"
+
     def test_to_png(self):
         """Test converting to PNG."""
         renderer = Renderer()
@@ -354,6 +419,28 @@ class TestRenderer:
         assert png_bytes[:8] == b"\x89PNG\r\n\x1a\n"
         assert len(png_bytes) > 0
 
+    def test_reused_encode_buffers_do_not_leak_previous_output(self):
+        """Test a small encode after a large one returns only its own bytes."""
+        from unittest.mock import patch
+
+        renderer = Renderer()
+        busy, draw = renderer.create_canvas()
+        for x in range(0, busy.width, 4):
+            draw.line([(x, 0), (busy.width - x, busy.height)], fill=(x % 256, 80, 200))
+        blank, _ = renderer.create_canvas()
+
+        with patch("custom_components.geekmagic.renderer._get_turbojpeg", return_value=None):
+            large_png = renderer.to_png(busy)
+            large_jpeg = renderer.to_jpeg(busy)
+            small_png = renderer.to_png(blank)
+            small_jpeg = renderer.to_jpeg(blank)
+            fresh = Renderer()
+            assert small_png == fresh.to_png(blank)
+            assert small_jpeg == fresh.to_jpeg(blank)
+
+        assert len(small_png) < len(large_png)
+        assert len(small_jpeg) < len(large_jpeg)
+
     def test_to_jpeg_rotation(self):
         """Test JPEG rotation parameter."""
         renderer = Renderer()
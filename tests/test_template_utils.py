@@ -1,6 +1,9 @@
 """Tests for template option helpers."""
 
+from unittest.mock import patch
+
 from custom_components.geekmagic.template_utils import (
+    _get_template,
     render_numeric_template,
     render_string_template,
     resolve_widget_template_options,
@@ -118,3 +121,32 @@ class TestTemplateUtils:
             },
         )
         assert resolved == {"min": 10.0, "max": 90.0}
+
+    def test_templates_are_cached_per_source(self, hass):
+        """Test that a template source is compiled into one reused Template."""
+        template = _get_template(hass, "{{ states('sensor.foo') }}")
+
+        assert _get_template(hass, "{{ states('sensor.foo') }}") is template
+        assert _get_template(hass, "{{ states('sensor.bar') }}") is not template
+
+    def test_shared_results_render_each_source_once(self, hass):
+        """Test that widgets sharing a results dict share one render per source."""
+        results: dict[str, str | None] = {}
+        options = {"min_template": "{{ 5 }}", "max_template": "{{ 5 }}"}
+        with patch(
+            "custom_components.geekmagic.template_utils._render_source",
+            return_value="5",
+        ) as render_source:
+            first = resolve_widget_template_options(hass, "gauge", options, results)
+            second = resolve_widget_template_options(hass, "gauge", options, results)
+
+        assert first == second == {"min": 5.0, "max": 5.0}
+        assert render_source.call_count == 1
+
+    def test_literal_text_skips_rendering(self, hass):
+        """Test that sources without Jinja delimiters are returned as-is."""
+        with patch("custom_components.geekmagic.template_utils._render_source") as render_source:
+            assert render_string_template(hass, "  Living room ") == "Living room"
+            assert render_numeric_template(hass, "42") == 42.0
+
+        render_source.assert_not_called()
@@ -27,11 +27,13 @@ class TestPreviewTimezone:
             tz_option = widget_data.get("options", {}).get("timezone")
             if tz_option:
                 widget_tz = ZoneInfo(tz_option)
-                widget_now = datetime.now(tz=widget_tz)
+                widget_now = now.astimezone(widget_tz)
 
         # Verify the timezone was applied
         assert widget_now.tzinfo is not None
         assert str(widget_now.tzinfo) == "America/New_York"
+        # Same instant as the shared render time, only the zone differs
+        assert widget_now == now
 
     def test_timezone_override_empty_string_uses_default(self):
         """Test that empty timezone string uses default timezone."""
@@ -50,7 +52,7 @@ class TestPreviewTimezone:
             tz_option = widget_data.get("options", {}).get("timezone")
             if tz_option:  # Empty string is falsy
                 widget_tz = ZoneInfo(tz_option)
-                widget_now = datetime.now(tz=widget_tz)
+                widget_now = now.astimezone(widget_tz)
 
         # Should still have the base timezone since empty string is falsy
         assert str(widget_now.tzinfo) == "Europe/Paris"
@@ -72,7 +74,7 @@ class TestPreviewTimezone:
             tz_option = widget_data.get("options", {}).get("timezone")
             if tz_option:
                 widget_tz = ZoneInfo(tz_option)
-                widget_now = datetime.now(tz=widget_tz)
+                widget_now = now.astimezone(widget_tz)
 
         # Should still have the base timezone (entity widget doesn't get override)
         assert str(widget_now.tzinfo) == "Europe/Paris"
@@ -96,7 +98,7 @@ class TestPreviewTimezone:
             if tz_option:
                 with contextlib.suppress(Exception):
                     widget_tz = ZoneInfo(tz_option)
-                    widget_now = datetime.now(tz=widget_tz)
+                    widget_now = now.astimezone(widget_tz)
 
         # Should fall back to base timezone on invalid timezone
         assert str(widget_now.tzinfo) == "Europe/Paris"
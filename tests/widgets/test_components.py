@@ -68,6 +68,20 @@ class TestText:
         args = mock_ctx.draw_text.call_args
         assert args[0][1] == (10, 40)  # x=10, y=20+20
 
+    def test_truncate_keeps_longest_fitting_prefix(self, mock_ctx: MagicMock) -> None:
+        """Test truncation picks the longest prefix that fits with ellipsis."""
+        mock_ctx.get_text_size.side_effect = lambda text, _font: (len(text) * 10, 16)
+        text = Text("Temperature", align="start", truncate=True)
+        text.render(mock_ctx, 0, 0, 55, 20)
+        assert mock_ctx.draw_text.call_args[0][0] == "Temp…"
+
+    def test_truncate_nothing_fits(self, mock_ctx: MagicMock) -> None:
+        """Test truncation falls back to a bare ellipsis."""
+        mock_ctx.get_text_size.side_effect = lambda text, _font: (len(text) * 10, 16)
+        text = Text("Temperature", align="start", truncate=True)
+        text.render(mock_ctx, 0, 0, 15, 20)
+        assert mock_ctx.draw_text.call_args[0][0] == "…"
+
 
 class TestIcon:
     """Tests for Icon component."""
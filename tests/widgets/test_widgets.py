@@ -1,12 +1,7 @@
 """Tests for widget classes."""
 
-import sys
 from datetime import UTC, datetime
-from pathlib import Path
 from typing import Any
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from unittest.mock import MagicMock
 
 import pytest
@@ -21,9 +16,12 @@ from custom_components.geekmagic.widgets.clock import ClockWidget
 from custom_components.geekmagic.widgets.entity import EntityWidget
 from custom_components.geekmagic.widgets.gauge import GaugeWidget
 from custom_components.geekmagic.widgets.helpers import (
+    calculate_percent,
     get_binary_sensor_icon,
     get_domain_state_icon,
+    is_entity_on,
     parse_color,
+    parse_float,
     translate_binary_state,
 )
 from custom_components.geekmagic.widgets.media import MediaWidget
@@ -41,6 +39,11 @@ from custom_components.geekmagic.widgets.status import (
     StatusWidget,
 )
 from custom_components.geekmagic.widgets.text import TextDisplay, TextWidget
+from custom_components.geekmagic.widgets.theme import (
+    DEFAULT_THEME,
+    THEME_NEON,
+    get_theme,
+)
 from custom_components.geekmagic.widgets.weather import WeatherWidget
 
 
@@ -192,6 +195,66 @@ class TestTranslateBinaryState:
         assert translate_binary_state("unknown", "motion") == "unknown"
 
 
+class TestIsEntityOn:
+    """Tests for is_entity_on helper."""
+
+    def test_lowercase_states(self):
+        """Test that lowercase on-states match and others do not."""
+        assert is_entity_on(MagicMock(state="on"))
+        assert is_entity_on(MagicMock(state="1"))
+        assert not is_entity_on(MagicMock(state="off"))
+        assert not is_entity_on(MagicMock(state="unavailable"))
+
+    def test_case_insensitive(self):
+        """Test that mixed-case states still match."""
+        assert is_entity_on(MagicMock(state="ON"))
+        assert is_entity_on(MagicMock(state="Home"))
+        assert not is_entity_on(MagicMock(state="OFF"))
+
+    def test_none_state(self):
+        """Test that a missing entity is off."""
+        assert not is_entity_on(None)
+
+
+class TestCalculatePercent:
+    """Tests for calculate_percent helper."""
+
+    def test_in_range(self):
+        """Test values inside the range map linearly."""
+        assert calculate_percent(5, 0, 10) == 50.0
+        assert calculate_percent(15, 10, 20) == 50.0
+
+    def test_clamps_out_of_range(self):
+        """Test values outside the range clamp to 0 and 100."""
+        assert calculate_percent(-5, 0, 10) == 0.0
+        assert calculate_percent(50, 0, 10) == 100.0
+
+    def test_empty_range(self):
+        """Test an empty or inverted range yields 0."""
+        assert calculate_percent(5, 10, 10) == 0.0
+        assert calculate_percent(5, 10, 0) == 0.0
+
+
+class TestParseFloat:
+    """Tests for parse_float helper."""
+
+    def test_numbers_and_numeric_strings(self):
+        """Test that numbers and numeric strings parse to floats."""
+        assert parse_float(3) == 3.0
+        assert parse_float(2.5) == 2.5
+        assert parse_float("-1.5e3") == -1500.0
+        assert parse_float(" 42 ") == 42.0
+
+    def test_non_numeric_values(self):
+        """Test that HA placeholder states and other values return None."""
+        assert parse_float("unavailable") is None
+        assert parse_float("unknown") is None
+        assert parse_float("") is None
+        assert parse_float("abc") is None
+        assert parse_float(None) is None
+        assert parse_float([1]) is None
+
+
 class TestBinarySensorIcons:
     """Tests for get_binary_sensor_icon helper - reads from HA JSON files."""
 
@@ -283,6 +346,22 @@ class TestParseColor:
         assert parse_color({"r": 255, "g": 128, "b": 0}, default) == default
 
 
+class TestGetTheme:
+    """Tests for get_theme lookup."""
+
+    def test_exact_name(self):
+        """Test that registered names resolve to their theme."""
+        assert get_theme("neon") is THEME_NEON
+
+    def test_name_is_normalized(self):
+        """Test that case and surrounding whitespace are ignored."""
+        assert get_theme(" Neon ") is THEME_NEON
+
+    def test_unknown_name_returns_default(self):
+        """Test that unknown names fall back to the default theme."""
+        assert get_theme("does-not-exist") is DEFAULT_THEME
+
+
 class TestDomainStateIcons:
     """Tests for get_domain_state_icon helper - reads from HA JSON files."""
 
@@ -345,6 +424,30 @@ class TestWidgetConfig:
         assert config.color == COLOR_CYAN
         assert config.options["show_name"] is True
 
+    def test_config_is_frozen(self):
+        """Test that widget config fields can't be reassigned."""
+        import dataclasses
+
+        config = WidgetConfig(widget_type="clock", slot=0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.slot = 1  # type: ignore[misc]
+
+    def test_equal_configs_hash_equal(self):
+        """Test that equal configs hash equally, including nested options."""
+        first = WidgetConfig(
+            widget_type="multi_progress",
+            options={"items": [{"entity_id": "sensor.a"}], "title": "A"},
+        )
+        second = WidgetConfig(
+            widget_type="multi_progress",
+            options={"title": "A", "items": [{"entity_id": "sensor.a"}]},
+        )
+        other = WidgetConfig(widget_type="multi_progress", options={"title": "B"})
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert len({first, second, other}) == 2
+
 
 class TestClockWidget:
     """Tests for ClockWidget."""
@@ -388,6 +491,16 @@ class TestClockWidget:
         # Verify image is valid
         assert img.size == (480, 480)
 
+    def test_state_key_ignores_seconds_when_hidden(self):
+        """Test clock cache key only changes when the displayed time changes."""
+        widget = ClockWidget(WidgetConfig(widget_type="clock", slot=0))
+        early = WidgetState(now=datetime(2024, 1, 1, 12, 30, 5, tzinfo=UTC))
+        late = WidgetState(now=datetime(2024, 1, 1, 12, 30, 55, tzinfo=UTC))
+        next_minute = WidgetState(now=datetime(2024, 1, 1, 12, 31, 0, tzinfo=UTC))
+
+        assert widget.state_key(early) == widget.state_key(late)
+        assert widget.state_key(early) != widget.state_key(next_minute)
+
     def test_render_24h(self, renderer, canvas, rect):
         """Test clock with 24-hour format."""
         img, draw = canvas
@@ -966,6 +1079,26 @@ class TestGaugeWidget:
         assert widget.max_value == 50
         assert widget.unit == "%"
 
+    def test_threshold_color(self):
+        """Test threshold colors pick the highest threshold at or below the value."""
+        config = WidgetConfig(
+            widget_type="gauge",
+            slot=0,
+            options={
+                "color_thresholds": [
+                    {"value": 80, "color": [255, 0, 0]},
+                    {"value": "50", "color": [255, 165, 0]},
+                    {"value": 0, "color": [0, 255, 0]},
+                    {"value": 90},
+                ]
+            },
+        )
+        widget = GaugeWidget(config)
+        assert widget._get_threshold_color(-1) is None
+        assert widget._get_threshold_color(0) == (0, 255, 0)
+        assert widget._get_threshold_color(50) == (255, 165, 0)
+        assert widget._get_threshold_color(95) == (255, 0, 0)
+
     def test_render_bar_style(self, renderer, canvas, rect, hass):
         """Test rendering bar gauge."""
         img, draw = canvas
@@ -1051,9 +1184,7 @@ class TestGaugeWidget:
         for child in component.children:
             if isinstance(child, Column):
                 text_values.extend(
-                    text_child.text
-                    for text_child in child.children
-                    if isinstance(text_child, Text)
+                    text_child.text for text_child in child.children if isinstance(text_child, Text)
                 )
 
         assert "23.5" in text_values
@@ -1158,9 +1289,7 @@ class TestGaugeWidget:
         assert isinstance(component.children[0], Ring)
         assert component.children[0].percent == 50.0
 
-    def test_template_bounds_take_precedence_over_entity_bounds(
-        self, renderer, canvas, rect, hass
-    ):
+    def test_template_bounds_take_precedence_over_entity_bounds(self, renderer, canvas, rect, hass):
         """Test pre-resolved template bounds override min/max entity bounds."""
         _img, draw = canvas
         ctx = RenderContext(draw, rect, renderer)
@@ -1437,6 +1566,13 @@ class TestProgressWidget:
         assert component.precision == 2
         assert component.value == 12.345
 
+    def test_display_components_have_no_instance_dict(self):
+        """Test progress display components are slotted."""
+        single = ProgressDisplay(label="Steps", value=1.0, target=2.0)
+        multi = MultiProgressDisplay(items=[])
+        assert not hasattr(single, "__dict__")
+        assert not hasattr(multi, "__dict__")
+
     def test_get_entities_includes_target_entity(self):
         """Test progress dependencies include target entity."""
         config = WidgetConfig(
@@ -1482,6 +1618,22 @@ class TestMultiProgressWidget:
         assert "sensor.calories" in widget.get_entities()
         assert "sensor.goal" in widget.get_entities()
 
+    def test_get_entities_deduplicates_in_order(self):
+        """Test shared entity IDs are listed once, in first-seen order."""
+        config = WidgetConfig(
+            widget_type="multi_progress",
+            slot=0,
+            options={
+                "items": [
+                    {"entity_id": "sensor.steps", "target_entity": "sensor.goal"},
+                    {"entity_id": "sensor.goal", "target_entity": "sensor.steps"},
+                    {"entity_id": "sensor.calories"},
+                ]
+            },
+        )
+        widget = MultiProgressWidget(config)
+        assert widget.get_entities() == ["sensor.steps", "sensor.goal", "sensor.calories"]
+
     def test_render_with_items(self, renderer, canvas, rect, hass):
         """Test rendering with multiple items."""
         img, draw = canvas